@@ -1,9 +1,13 @@
 """Application setup and configuration."""
 
 import sys
+from typing import Optional
+
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtCore import Qt, QFile, QIODevice, QTimer
+from PySide6.QtGui import QPalette, QColor, QPixmapCache
+
+from .resources import resources_rc  # noqa: F401 - registers :/theme/dark.qss
 
 
 def create_application() -> QApplication:
@@ -18,14 +22,41 @@ def create_application() -> QApplication:
     app.setOrganizationName("TileSplitter")
     app.setOrganizationDomain("tilesplitter.local")
 
-    # Apply dark theme
-    _apply_dark_theme(app)
+    # Room for tile previews (128x128 each) beyond Qt's 10 MB default
+    QPixmapCache.setCacheLimit(32 * 1024)  # KB
+
+    # Apply dark theme: palette now, stylesheet once the event loop runs
+    # so parsing it doesn't hold up the first window paint
+    _apply_dark_palette(app)
+    QTimer.singleShot(0, lambda: _apply_dark_stylesheet(app))
 
     return app
 
 
-def _apply_dark_theme(app: QApplication) -> None:
+# Dark palette, built on first use and shared by every later call
+_dark_palette: Optional[QPalette] = None
+
+
+def _apply_dark_palette(app: QApplication) -> None:
     """Apply a dark color palette to the application."""
+    app.setPalette(_get_dark_palette())
+
+
+def _apply_dark_stylesheet(app: QApplication) -> None:
+    """Apply the stylesheet for fine-tuning, compiled into the Qt resource."""
+    app.setStyleSheet(_load_stylesheet(":/theme/dark.qss"))
+
+
+def _get_dark_palette() -> QPalette:
+    """Get the cached dark palette, building it on first call."""
+    global _dark_palette
+    if _dark_palette is None:
+        _dark_palette = _build_dark_palette()
+    return _dark_palette
+
+
+def _build_dark_palette() -> QPalette:
+    """Build the dark color palette."""
     palette = QPalette()
 
     # Base colors
@@ -70,125 +101,15 @@ def _apply_dark_theme(app: QApplication) -> None:
         disabled
     )
 
-    app.setPalette(palette)
-
-    # Additional stylesheet for fine-tuning
-    app.setStyleSheet("""
-        QToolTip {
-            background-color: #232323;
-            color: #cccccc;
-            border: 1px solid #555555;
-            padding: 4px;
-        }
-
-        QGroupBox {
-            border: 1px solid #555555;
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 8px;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            left: 8px;
-            padding: 0 4px;
-        }
-
-        QLineEdit, QSpinBox, QComboBox {
-            background-color: #2a2a2a;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 4px;
-        }
-
-        QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
-            border-color: #4682b4;
-        }
-
-        QPushButton {
-            background-color: #3a3a3a;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 6px 12px;
-        }
-
-        QPushButton:hover {
-            background-color: #454545;
-        }
-
-        QPushButton:pressed {
-            background-color: #353535;
-        }
-
-        QPushButton:disabled {
-            background-color: #2a2a2a;
-            color: #666666;
-        }
-
-        QTableWidget {
-            background-color: #2a2a2a;
-            gridline-color: #404040;
-        }
-
-        QTableWidget::item:selected {
-            background-color: #4682b4;
-        }
-
-        QHeaderView::section {
-            background-color: #353535;
-            border: 1px solid #404040;
-            padding: 4px;
-        }
-
-        QScrollBar:vertical {
-            background-color: #2a2a2a;
-            width: 12px;
-        }
-
-        QScrollBar::handle:vertical {
-            background-color: #4a4a4a;
-            border-radius: 4px;
-            min-height: 20px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background-color: #5a5a5a;
-        }
-
-        QScrollBar:horizontal {
-            background-color: #2a2a2a;
-            height: 12px;
-        }
-
-        QScrollBar::handle:horizontal {
-            background-color: #4a4a4a;
-            border-radius: 4px;
-            min-width: 20px;
-        }
-
-        QScrollBar::handle:horizontal:hover {
-            background-color: #5a5a5a;
-        }
-
-        QMenuBar {
-            background-color: #2d2d2d;
-        }
-
-        QMenuBar::item:selected {
-            background-color: #4682b4;
-        }
-
-        QMenu {
-            background-color: #2d2d2d;
-            border: 1px solid #404040;
-        }
-
-        QMenu::item:selected {
-            background-color: #4682b4;
-        }
-
-        QStatusBar {
-            background-color: #252525;
-        }
-    """)
+    return palette
+
+
+def _load_stylesheet(resource_path: str) -> str:
+    """Read a stylesheet from the compiled Qt resources."""
+    qss_file = QFile(resource_path)
+    if not qss_file.open(QIODevice.OpenModeFlag.ReadOnly):
+        return ""
+    try:
+        return bytes(qss_file.readAll()).decode("utf-8")
+    finally:
+        qss_file.close()
@@ -1,5 +1,7 @@
 """Undo/Redo commands for rename operations."""
 
+from typing import Optional
+
 from PySide6.QtGui import QUndoCommand
 
 from ..models import Tile, Tileset
@@ -20,21 +22,39 @@ class RenameDuplicatesCommand(QUndoCommand):
         self._tile = tile
         self._new_name = new_name
 
-        # Store old names for all duplicates
-        self._duplicates = tileset.get_duplicate_tiles(tile)
-        self._old_names = [t.custom_name for t in self._duplicates]
+        # Duplicates and their old names, captured on first redo
+        self._duplicates: Optional[tuple[Tile, ...]] = None
+        self._old_names: Optional[tuple[Optional[str], ...]] = None
+
+        self.setText(f"Rename tile to '{new_name}'")
+
+    @property
+    def tile(self) -> Tile:
+        """Get the tile this command renames."""
+        return self._tile
 
+    def set_new_name(self, new_name: str) -> None:
+        """Change the target name of this (already applied) rename."""
+        self._new_name = new_name
         self.setText(f"Rename tile to '{new_name}'")
+        self.redo()
+
+    def _capture(self) -> None:
+        """Store old names for all duplicates before the first rename."""
+        self._duplicates = tuple(self._tileset.get_duplicate_tiles(self._tile))
+        self._old_names = tuple(t.custom_name for t in self._duplicates)
 
     def redo(self) -> None:
         """Apply the rename to all duplicates."""
+        if self._duplicates is None:
+            self._capture()
         for t in self._duplicates:
-            t.name = self._new_name
+            self._tileset.set_tile_name(t, self._new_name)
 
     def undo(self) -> None:
         """Revert the rename for all duplicates."""
         for t, old_name in zip(self._duplicates, self._old_names):
-            t.custom_name = old_name
+            self._tileset.set_tile_name(t, old_name)
 
     def id(self) -> int:
         return 1001
@@ -1,6 +1,19 @@
 """Main entry point for Tile Splitter."""
 
 import sys
+import threading
+
+# Modules not needed for the first paint, imported in the background
+PRELOAD_MODULES = ("requests",)
+
+
+def _preload_modules() -> None:
+    """Import heavy pure-Python modules ahead of first use."""
+    for name in PRELOAD_MODULES:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
 
 
 def main() -> int:
@@ -13,6 +26,9 @@ def main() -> int:
     window = MainWindow()
     window.show()
 
+    # Import only, never create Qt objects off the main thread
+    threading.Thread(target=_preload_modules, daemon=True).start()
+
     return app.exec()
 
 
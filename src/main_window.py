@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QGroupBox,
 )
 
-from .models import Tileset, GridSettings
+from .models import Tileset, Tile, GridSettings
 from .services import ImageLoader, SettingsManager
 from .widgets import (
     TilesetView, TileEditor, GridSettingsWidget,
@@ -28,14 +28,22 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Services
+        # Services (image loader is created on first load)
         self._settings = SettingsManager()
-        self._image_loader = ImageLoader()
+        self._image_loader: Optional[ImageLoader] = None
+
+        # Last output folder text that was checked to exist on disk
+        self._validated_folder_text = ""
+        self._validated_folder: Optional[Path] = None
 
         # State
         self._tileset: Optional[Tileset] = None
         self._undo_stack = QUndoStack(self)
 
+        # Unique tile navigation cache (rebuilt when tiles are regenerated)
+        self._unique_indices: Optional[list[int]] = None
+        self._unique_positions: Optional[dict[int, int]] = None
+
         # Rename timer for debouncing
         self._rename_timer = QTimer()
         self._rename_timer.setSingleShot(True)
@@ -43,10 +51,29 @@ class MainWindow(QMainWindow):
         self._rename_timer.timeout.connect(self._commit_tile_rename)
         self._pending_tile_name: Optional[str] = None
 
+        # Rename command kept open while the same tile is being edited
+        self._open_rename: Optional[RenameDuplicatesCommand] = None
+
+        # Set rename timer, debounced the same way
+        self._set_rename_timer = QTimer()
+        self._set_rename_timer.setSingleShot(True)
+        self._set_rename_timer.setInterval(500)  # 500ms debounce
+        self._set_rename_timer.timeout.connect(self._commit_set_rename)
+        self._pending_set_name: Optional[str] = None
+
+        # Grid update timer, so spinbox scrolling rebuilds tiles only once
+        self._grid_update_timer = QTimer()
+        self._grid_update_timer.setSingleShot(True)
+        self._grid_update_timer.setInterval(50)  # 50ms debounce
+        self._grid_update_timer.timeout.connect(self._do_grid_update)
+
         self._setup_ui()
         self._setup_actions()
         self._setup_shortcuts()
-        self._restore_state()
+        self._restore_geometry()
+
+        # Remaining settings are restored once the event loop is running
+        QTimer.singleShot(0, self._restore_state)
 
     def _setup_ui(self) -> None:
         """Setup the main window UI."""
@@ -150,32 +177,34 @@ class MainWindow(QMainWindow):
         open_action = QAction("&Open...", self)
         open_action.setShortcut(QKeySequence.StandardKey.Open)
         open_action.triggered.connect(self._open_file)
-        file_menu.addAction(open_action)
-
-        file_menu.addSeparator()
 
         export_action = QAction("&Export...", self)
         export_action.setShortcut(QKeySequence("Ctrl+E"))
         export_action.triggered.connect(self._show_export_dialog)
-        file_menu.addAction(export_action)
-
-        file_menu.addSeparator()
 
         exit_action = QAction("E&xit", self)
         exit_action.setShortcut(QKeySequence.StandardKey.Quit)
         exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+
+        # Add everything in one call so the menu is only invalidated once
+        file_menu.addActions([
+            open_action,
+            self._create_separator(),
+            export_action,
+            self._create_separator(),
+            exit_action,
+        ])
 
         # Edit menu
         edit_menu = self.menuBar().addMenu("&Edit")
 
         self._undo_action = self._undo_stack.createUndoAction(self, "&Undo")
         self._undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        edit_menu.addAction(self._undo_action)
 
         self._redo_action = self._undo_stack.createRedoAction(self, "&Redo")
         self._redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        edit_menu.addAction(self._redo_action)
+
+        edit_menu.addActions([self._undo_action, self._redo_action])
 
         # View menu
         view_menu = self.menuBar().addMenu("&View")
@@ -183,12 +212,18 @@ class MainWindow(QMainWindow):
         reset_zoom_action = QAction("&Fit to Window", self)
         reset_zoom_action.setShortcut(QKeySequence("Ctrl+0"))
         reset_zoom_action.triggered.connect(self._tileset_view.reset_zoom)
-        view_menu.addAction(reset_zoom_action)
 
         actual_size_action = QAction("&Actual Size (100%)", self)
         actual_size_action.setShortcut(QKeySequence("Ctrl+1"))
         actual_size_action.triggered.connect(self._tileset_view.zoom_to_actual)
-        view_menu.addAction(actual_size_action)
+
+        view_menu.addActions([reset_zoom_action, actual_size_action])
+
+    def _create_separator(self) -> QAction:
+        """Create a separator action for batch menu construction."""
+        separator = QAction(self)
+        separator.setSeparator(True)
+        return separator
 
     def _setup_shortcuts(self) -> None:
         """Setup keyboard shortcuts."""
@@ -202,9 +237,8 @@ class MainWindow(QMainWindow):
         prev_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Tab | Qt.KeyboardModifier.ShiftModifier), self)
         prev_shortcut.activated.connect(self._select_prev_unique_tile)
 
-    def _restore_state(self) -> None:
-        """Restore window state from settings."""
-        # Window geometry
+    def _restore_geometry(self) -> None:
+        """Restore window geometry (before show, to avoid a visible jump)."""
         geometry = self._settings.get_window_geometry()
         if geometry:
             self.restoreGeometry(geometry)
@@ -213,6 +247,8 @@ class MainWindow(QMainWindow):
         if state:
             self.restoreState(state)
 
+    def _restore_state(self) -> None:
+        """Restore output folder and grid settings from settings."""
         # Output folder
         output_folder = self._settings.get_output_folder()
         if output_folder and output_folder.exists():
@@ -252,63 +288,89 @@ class MainWindow(QMainWindow):
     def _load_file(self, path: str) -> None:
         """Load a tileset file."""
         file_path = Path(path)
+        file_name = file_path.name
 
         # Load image
-        image = self._image_loader.load_image(file_path)
+        loader = self._get_image_loader()
+        image = loader.load_image(file_path)
         if image is None:
             QMessageBox.warning(
                 self,
                 "Load Failed",
-                f"Could not load image: {file_path.name}"
+                f"Could not load image: {file_name}"
             )
             return
 
         # Extract license info
-        license_info = self._image_loader.extract_license_info(file_path)
+        license_info = loader.extract_license_info(file_path)
 
         # Create tileset
         self._tileset = Tileset(
             source_path=file_path,
-            source_format=self._image_loader.get_format(file_path),
+            source_format=loader.get_format(file_path),
             grid_settings=self._grid_settings.settings,
             license_info=license_info,
         )
         self._tileset.image = image
+        self._invalidate_unique_tiles()
+
+        # Drop any set rename still pending for the previous tileset
+        self._set_rename_timer.stop()
+        self._pending_set_name = None
 
         # Generate default set name
         output_folder = self._get_output_folder()
         if output_folder:
-            default_name = generate_default_set_name(output_folder)
-            self._set_name_edit.setText(default_name)
-            self._tileset.set_name = default_name
-
-        # Update UI
-        self._tileset_view.tileset = self._tileset
-        self._tileset_view.show_grid = self._grid_settings.show_grid
-        self._tileset_view.hide_labeled = self._grid_settings.hide_labeled
-        self._license_display.license_info = license_info
-        self._tile_editor.clear()
-
-        # Update tile count
-        self._update_tile_count()
+            self._tileset.set_name = generate_default_set_name(output_folder)
+
+        # Batch the widget updates below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            if output_folder:
+                self._set_set_name_text(self._tileset.set_name)
+
+            # Update UI
+            self._tileset_view.tileset = self._tileset
+            self._tileset_view.show_grid = self._grid_settings.show_grid
+            self._tileset_view.hide_labeled = self._grid_settings.hide_labeled
+            self._license_display.license_info = license_info
+            self._tile_editor.clear()
+
+            # Update tile count
+            self._update_tile_count()
 
-        # Enable export
-        self._export_btn.setEnabled(True)
+            # Enable export
+            self._export_btn.setEnabled(True)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
         # Add to recent files
         self._settings.add_recent_file(file_path)
 
-        # Clear undo stack
+        # Clear undo stack (this deletes any open rename command)
+        self._open_rename = None
         self._undo_stack.clear()
 
-        self.setWindowTitle(f"Tile Splitter - {file_path.name}")
+        self.setWindowTitle(f"Tile Splitter - {file_name}")
+
+    def _get_image_loader(self) -> ImageLoader:
+        """Get the image loader, creating it on first use."""
+        if self._image_loader is None:
+            self._image_loader = ImageLoader()
+        return self._image_loader
 
     def _get_output_folder(self) -> Optional[Path]:
         """Get the current output folder."""
         text = self._output_folder_edit.text()
         if text:
+            # Only stat the folder again when the text has changed
+            if text == self._validated_folder_text:
+                return self._validated_folder
             path = Path(text)
             if path.exists():
+                self._validated_folder_text = text
+                self._validated_folder = path
                 return path
         return self._settings.get_output_folder()
 
@@ -327,10 +389,15 @@ class MainWindow(QMainWindow):
     # Grid settings handlers
 
     def _on_grid_settings_changed(self) -> None:
-        """Handle grid settings change."""
+        """Handle grid settings change (debounced)."""
+        self._grid_update_timer.start()
+
+    def _do_grid_update(self) -> None:
+        """Rebuild tiles and grid for the current grid settings."""
         if self._tileset:
             self._tileset.grid_settings = self._grid_settings.settings
             self._tileset_view.update_grid()
+            self._invalidate_unique_tiles()
             self._update_tile_count()
 
             # Clear selection if tile no longer exists
@@ -358,24 +425,12 @@ class MainWindow(QMainWindow):
             return
 
         current = self._tileset.selected_tile_index
-        if current is None:
-            # No selection, select first unique tile
+        pos = self._get_unique_position(current) if current is not None else None
+        if pos is None:
+            # No selection (or unknown group), select first unique tile
             next_idx = unique_indices[0]
         else:
-            # Find current position in unique list and go to next
-            # First, find which unique group we're in
-            current_tile = self._tileset.tiles[current]
-            current_group = current_tile.duplicate_group_id
-            if current_group is None:
-                current_group = current
-
-            # Find this group in unique_indices and go to next
-            try:
-                pos = unique_indices.index(current_group)
-                next_pos = (pos + 1) % len(unique_indices)
-                next_idx = unique_indices[next_pos]
-            except ValueError:
-                next_idx = unique_indices[0]
+            next_idx = unique_indices[(pos + 1) % len(unique_indices)]
 
         self._select_tile_by_index(next_idx)
 
@@ -389,40 +444,51 @@ class MainWindow(QMainWindow):
             return
 
         current = self._tileset.selected_tile_index
-        if current is None:
-            # No selection, select last unique tile
+        pos = self._get_unique_position(current) if current is not None else None
+        if pos is None:
+            # No selection (or unknown group), select last unique tile
             next_idx = unique_indices[-1]
         else:
-            # Find current position in unique list and go to previous
-            current_tile = self._tileset.tiles[current]
-            current_group = current_tile.duplicate_group_id
-            if current_group is None:
-                current_group = current
-
-            try:
-                pos = unique_indices.index(current_group)
-                prev_pos = (pos - 1) % len(unique_indices)
-                next_idx = unique_indices[prev_pos]
-            except ValueError:
-                next_idx = unique_indices[-1]
+            next_idx = unique_indices[(pos - 1) % len(unique_indices)]
 
         self._select_tile_by_index(next_idx)
 
     def _get_unique_tile_indices(self) -> list[int]:
-        """Get indices of first tile in each duplicate group."""
+        """Get indices of first tile in each duplicate group (cached)."""
         if self._tileset is None:
             return []
 
-        seen_groups: set[int] = set()
-        unique_indices: list[int] = []
+        if self._unique_indices is None:
+            self._tileset.ensure_duplicate_groups()
+
+            # The position dict doubles as the seen-groups set
+            positions: dict[int, int] = {}
+            unique_indices: list[int] = []
+
+            for i, tile in enumerate(self._tileset.tiles):
+                group_id = tile.duplicate_group_id
+                if group_id is None:
+                    group_id = i
+                if group_id not in positions:
+                    positions[group_id] = len(unique_indices)
+                    unique_indices.append(i)
+
+            self._unique_indices = unique_indices
+            self._unique_positions = positions
+
+        return self._unique_indices
 
-        for i, tile in enumerate(self._tileset.tiles):
-            group_id = tile.duplicate_group_id if tile.duplicate_group_id is not None else i
-            if group_id not in seen_groups:
-                seen_groups.add(group_id)
-                unique_indices.append(i)
+    def _get_unique_position(self, index: int) -> Optional[int]:
+        """Get the position of a tile's duplicate group in the unique list."""
+        self._get_unique_tile_indices()
+        tile = self._tileset.tiles[index]
+        group_id = tile.duplicate_group_id if tile.duplicate_group_id is not None else index
+        return self._unique_positions.get(group_id)
 
-        return unique_indices
+    def _invalidate_unique_tiles(self) -> None:
+        """Drop the unique tile cache after tiles are regenerated."""
+        self._unique_indices = None
+        self._unique_positions = None
 
     def _select_tile_by_index(self, index: int) -> None:
         """Select a tile by index and update UI."""
@@ -436,6 +502,8 @@ class MainWindow(QMainWindow):
     def _on_tile_selected(self, index: int) -> None:
         """Handle tile selection."""
         if self._tileset and 0 <= index < len(self._tileset.tiles):
+            # A new selection starts a new rename command
+            self._open_rename = None
             tile = self._tileset.tiles[index]
             duplicate_count = self._tileset.get_duplicate_count(tile)
             self._tile_editor.set_tile_with_duplicates(tile, duplicate_count)
@@ -461,9 +529,16 @@ class MainWindow(QMainWindow):
         if new_name == current_name:
             return
 
-        # Create and push command (handles duplicates)
-        command = RenameDuplicatesCommand(self._tileset, tile, new_name)
-        self._undo_stack.push(command)
+        if self._is_open_rename_for(tile):
+            # Keep editing the same command instead of pushing a new one
+            self._open_rename.set_new_name(new_name)
+        else:
+            # Create and push command (handles duplicates)
+            command = RenameDuplicatesCommand(self._tileset, tile, new_name)
+            self._undo_stack.push(command)
+            # Push may have merged the command into the previous one, so
+            # keep whichever command is now on top of the stack
+            self._open_rename = self._undo_stack.command(self._undo_stack.index() - 1)
 
         self._pending_tile_name = None
 
@@ -471,11 +546,26 @@ class MainWindow(QMainWindow):
         self._tileset_view.refresh_overlays()
         self._update_tile_count()
 
+    def _is_open_rename_for(self, tile: Tile) -> bool:
+        """Check if the open rename command targets tile and is still current."""
+        if self._open_rename is None or self._open_rename.tile is not tile:
+            return False
+        # Undone commands can't be edited in place
+        return self._undo_stack.command(self._undo_stack.index() - 1) is self._open_rename
+
     def _on_set_name_changed(self, new_name: str) -> None:
-        """Handle set name change."""
-        if self._tileset is None:
+        """Handle set name change (debounced)."""
+        self._pending_set_name = new_name
+        self._set_rename_timer.start()
+
+    def _commit_set_rename(self) -> None:
+        """Commit the pending set rename."""
+        if self._tileset is None or self._pending_set_name is None:
             return
 
+        new_name = self._pending_set_name
+        self._pending_set_name = None
+
         # Create command for undo
         if new_name != self._tileset.set_name:
             command = RenameSetCommand(self._tileset, new_name)
@@ -528,11 +618,18 @@ class MainWindow(QMainWindow):
                 self._output_folder_edit.setText(str(new_folder))
                 self._settings.set_output_folder(new_folder)
 
-            # Update set name
-            self._set_name_edit.setText(dialog.get_set_name())
+            # Update set name (the dialog already applied it to the tileset)
+            self._set_set_name_text(dialog.get_set_name())
 
     # Helpers
 
+    def _set_set_name_text(self, name: str) -> None:
+        """Set the set name field without creating an undo command."""
+        # Block signals to avoid triggering _on_set_name_changed
+        self._set_name_edit.blockSignals(True)
+        self._set_name_edit.setText(name)
+        self._set_name_edit.blockSignals(False)
+
     def _update_tile_count(self) -> None:
         """Update the tile count label."""
         if self._tileset:
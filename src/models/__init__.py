@@ -2,7 +2,7 @@
 
 from .tileset import Tileset, GridSettings
 from .tile import Tile
-from .license_info import LicenseInfo, LicenseWarning, get_license_url
+from .license_info import LicenseInfo, LicenseWarning, classify_license, get_license_url
 
 __all__ = [
     "Tileset",
@@ -10,5 +10,6 @@ __all__ = [
     "Tile",
     "LicenseInfo",
     "LicenseWarning",
+    "classify_license",
     "get_license_url",
 ]
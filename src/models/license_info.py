@@ -1,7 +1,9 @@
 """License information data model."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -19,46 +21,54 @@ class LicenseWarning(Enum):
 # Common license patterns and their warnings
 LICENSE_PATTERNS = {
     # Public Domain / Very Permissive
-    "cc0": ([], "Public Domain (CC0)"),
-    "public domain": ([], "Public Domain"),
-    "unlicense": ([], "Unlicense (Public Domain)"),
+    "cc0": (frozenset(), "Public Domain (CC0)"),
+    "public domain": (frozenset(), "Public Domain"),
+    "unlicense": (frozenset(), "Unlicense (Public Domain)"),
     # Attribution only
-    "cc by 4": ([], "CC BY 4.0"),
-    "cc by 3": ([], "CC BY 3.0"),
-    "cc-by-4": ([], "CC BY 4.0"),
-    "cc-by-3": ([], "CC BY 3.0"),
+    "cc by 4": (frozenset(), "CC BY 4.0"),
+    "cc by 3": (frozenset(), "CC BY 3.0"),
+    "cc-by-4": (frozenset(), "CC BY 4.0"),
+    "cc-by-3": (frozenset(), "CC BY 3.0"),
     # Share-alike (informational warning)
-    "cc by-sa": ([LicenseWarning.SHARE_ALIKE], "CC BY-SA"),
-    "cc-by-sa": ([LicenseWarning.SHARE_ALIKE], "CC BY-SA"),
+    "cc by-sa": (frozenset({LicenseWarning.SHARE_ALIKE}), "CC BY-SA"),
+    "cc-by-sa": (frozenset({LicenseWarning.SHARE_ALIKE}), "CC BY-SA"),
     # Non-commercial (yellow warning)
     "cc by-nc-sa": (
-        [LicenseWarning.NON_COMMERCIAL, LicenseWarning.SHARE_ALIKE],
+        frozenset({LicenseWarning.NON_COMMERCIAL, LicenseWarning.SHARE_ALIKE}),
         "CC BY-NC-SA",
     ),
     "cc by-nc-nd": (
-        [LicenseWarning.NON_COMMERCIAL, LicenseWarning.NO_DERIVATIVES],
+        frozenset({LicenseWarning.NON_COMMERCIAL, LicenseWarning.NO_DERIVATIVES}),
         "CC BY-NC-ND",
     ),
-    "cc by-nc": ([LicenseWarning.NON_COMMERCIAL], "CC BY-NC"),
-    "cc-by-nc": ([LicenseWarning.NON_COMMERCIAL], "CC BY-NC"),
-    "-nc-": ([LicenseWarning.NON_COMMERCIAL], None),
-    "non-commercial": ([LicenseWarning.NON_COMMERCIAL], None),
-    "noncommercial": ([LicenseWarning.NON_COMMERCIAL], None),
+    "cc by-nc": (frozenset({LicenseWarning.NON_COMMERCIAL}), "CC BY-NC"),
+    "cc-by-nc": (frozenset({LicenseWarning.NON_COMMERCIAL}), "CC BY-NC"),
+    "-nc-": (frozenset({LicenseWarning.NON_COMMERCIAL}), None),
+    "non-commercial": (frozenset({LicenseWarning.NON_COMMERCIAL}), None),
+    "noncommercial": (frozenset({LicenseWarning.NON_COMMERCIAL}), None),
     # No derivatives (red warning)
-    "cc by-nd": ([LicenseWarning.NO_DERIVATIVES], "CC BY-ND"),
-    "cc-by-nd": ([LicenseWarning.NO_DERIVATIVES], "CC BY-ND"),
-    "-nd": ([LicenseWarning.NO_DERIVATIVES], None),
-    "no derivatives": ([LicenseWarning.NO_DERIVATIVES], None),
-    "no-derivatives": ([LicenseWarning.NO_DERIVATIVES], None),
+    "cc by-nd": (frozenset({LicenseWarning.NO_DERIVATIVES}), "CC BY-ND"),
+    "cc-by-nd": (frozenset({LicenseWarning.NO_DERIVATIVES}), "CC BY-ND"),
+    "-nd": (frozenset({LicenseWarning.NO_DERIVATIVES}), None),
+    "no derivatives": (frozenset({LicenseWarning.NO_DERIVATIVES}), None),
+    "no-derivatives": (frozenset({LicenseWarning.NO_DERIVATIVES}), None),
     # Other permissive
-    "mit": ([], "MIT License"),
-    "apache": ([], "Apache License"),
-    "bsd": ([], "BSD License"),
-    "gpl": ([LicenseWarning.SHARE_ALIKE], "GPL"),
-    "lgpl": ([LicenseWarning.SHARE_ALIKE], "LGPL"),
-    "ofl": ([], "SIL Open Font License"),
+    "mit": (frozenset(), "MIT License"),
+    "apache": (frozenset(), "Apache License"),
+    "bsd": (frozenset(), "BSD License"),
+    "gpl": (frozenset({LicenseWarning.SHARE_ALIKE}), "GPL"),
+    "lgpl": (frozenset({LicenseWarning.SHARE_ALIKE}), "LGPL"),
+    "ofl": (frozenset(), "SIL Open Font License"),
 }
 
+# Warnings that has_warnings reports as concerning
+_CONCERNING_WARNINGS = frozenset({
+    LicenseWarning.NON_COMMERCIAL,
+    LicenseWarning.NO_DERIVATIVES,
+    LicenseWarning.UNKNOWN,
+    LicenseWarning.MISSING,
+})
+
 # License name to canonical URL mapping
 LICENSE_URLS = {
     "CC0": "https://creativecommons.org/publicdomain/zero/1.0/",
@@ -82,6 +92,12 @@ LICENSE_URLS = {
     "SIL Open Font License": "https://scripts.sil.org/OFL",
 }
 
+# Lowercased license name to URL, for case-insensitive lookups (reversed so
+# the first name wins)
+_LICENSE_URLS_LOWER = {
+    name.lower(): url for name, url in reversed(LICENSE_URLS.items())
+}
+
 
 def get_license_url(license_name: str) -> str:
     """Get canonical URL for a license name.
@@ -97,15 +113,76 @@ def get_license_url(license_name: str) -> str:
         return LICENSE_URLS[license_name]
 
     # Try case-insensitive lookup
-    name_lower = license_name.lower()
-    for key, url in LICENSE_URLS.items():
-        if key.lower() == name_lower:
-            return url
+    return _LICENSE_URLS_LOWER.get(license_name.lower(), "")
+
+
+def _normalize_license_text(license_text: str) -> str:
+    """Lowercase license text and collapse runs of whitespace.
+
+    The result is interned so equal licenses share one string, which also
+    makes the match cache hit regardless of line breaks or stray spaces.
+    """
+    return sys.intern(" ".join(license_text.lower().split()))
+
+
+@lru_cache(maxsize=512)
+def _match_license_pattern(normalized_text: str) -> Optional[str]:
+    """Find the first LICENSE_PATTERNS key contained in the license text.
 
-    return ""
+    Expects text from _normalize_license_text. Cached by that text, since
+    many tilesets share the same license string.
 
+    Returns:
+        The matching pattern, or None if no pattern matches.
+    """
+    for pattern in LICENSE_PATTERNS:
+        if pattern in normalized_text:
+            return pattern
+    return None
+
+
+@lru_cache(maxsize=64)
+def _build_warning_message(warnings: frozenset[LicenseWarning]) -> str:
+    """Get the warning message for a set of warnings.
+
+    Cached by the warnings, since there are only a few combinations and
+    the message is read on every license display update.
+    """
+    messages = []
+
+    if LicenseWarning.NO_DERIVATIVES in warnings:
+        messages.append(
+            "NO DERIVATIVES: This license prohibits creating derivative works. "
+            "Splitting and using these tiles may violate the license."
+        )
 
-@dataclass
+    if LicenseWarning.NON_COMMERCIAL in warnings:
+        messages.append(
+            "NON-COMMERCIAL: This license restricts commercial use. "
+            "Ensure your intended use complies."
+        )
+
+    if LicenseWarning.SHARE_ALIKE in warnings:
+        messages.append(
+            "SHARE-ALIKE: Derivatives must use the same license."
+        )
+
+    if LicenseWarning.UNKNOWN in warnings:
+        messages.append(
+            "UNKNOWN LICENSE: Could not parse license terms. "
+            "Please verify manually."
+        )
+
+    if LicenseWarning.MISSING in warnings:
+        messages.append(
+            "NO LICENSE: No license information found. "
+            "Assume all rights reserved unless you can verify otherwise."
+        )
+
+    return "\n\n".join(messages) if messages else ""
+
+
+@dataclass(slots=True)
 class LicenseInfo:
     """Represents license information for a tileset."""
 
@@ -113,7 +190,7 @@ class LicenseInfo:
     license_url: str = ""
     author: str = ""
     source_url: str = ""
-    warnings: list[LicenseWarning] = field(default_factory=list)
+    warnings: frozenset[LicenseWarning] = frozenset()
     normalized_name: Optional[str] = None  # e.g., "CC BY 4.0"
 
     def __post_init__(self):
@@ -123,31 +200,22 @@ class LicenseInfo:
 
     def _analyze_license(self) -> None:
         """Analyze license text to detect warnings and normalize name."""
-        text_lower = self.license_text.lower()
-
-        for pattern, (warnings, name) in LICENSE_PATTERNS.items():
-            if pattern in text_lower:
-                self.warnings = list(warnings)
-                if name and not self.normalized_name:
-                    self.normalized_name = name
-                return
+        pattern = _match_license_pattern(_normalize_license_text(self.license_text))
+        if pattern is not None:
+            warnings, name = LICENSE_PATTERNS[pattern]
+            self.warnings = warnings
+            if name and not self.normalized_name:
+                self.normalized_name = name
+            return
 
         # If we have text but couldn't parse it
         if self.license_text and not self.normalized_name:
-            self.warnings = [LicenseWarning.UNKNOWN]
+            self.warnings = frozenset({LicenseWarning.UNKNOWN})
 
     @property
     def has_warnings(self) -> bool:
         """Check if there are any concerning warnings."""
-        return any(
-            w in self.warnings
-            for w in [
-                LicenseWarning.NON_COMMERCIAL,
-                LicenseWarning.NO_DERIVATIVES,
-                LicenseWarning.UNKNOWN,
-                LicenseWarning.MISSING,
-            ]
-        )
+        return bool(self.warnings & _CONCERNING_WARNINGS)
 
     @property
     def has_blocking_warnings(self) -> bool:
@@ -169,38 +237,7 @@ class LicenseInfo:
     @property
     def warning_message(self) -> str:
         """Get a human-readable warning message."""
-        messages = []
-
-        if LicenseWarning.NO_DERIVATIVES in self.warnings:
-            messages.append(
-                "NO DERIVATIVES: This license prohibits creating derivative works. "
-                "Splitting and using these tiles may violate the license."
-            )
-
-        if LicenseWarning.NON_COMMERCIAL in self.warnings:
-            messages.append(
-                "NON-COMMERCIAL: This license restricts commercial use. "
-                "Ensure your intended use complies."
-            )
-
-        if LicenseWarning.SHARE_ALIKE in self.warnings:
-            messages.append(
-                "SHARE-ALIKE: Derivatives must use the same license."
-            )
-
-        if LicenseWarning.UNKNOWN in self.warnings:
-            messages.append(
-                "UNKNOWN LICENSE: Could not parse license terms. "
-                "Please verify manually."
-            )
-
-        if LicenseWarning.MISSING in self.warnings:
-            messages.append(
-                "NO LICENSE: No license information found. "
-                "Assume all rights reserved unless you can verify otherwise."
-            )
-
-        return "\n\n".join(messages) if messages else ""
+        return _build_warning_message(self.warnings)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -226,3 +263,14 @@ class LicenseInfo:
     def is_empty(self) -> bool:
         """Check if license info is essentially empty."""
         return not (self.license_text or self.license_url or self.author)
+
+
+@lru_cache(maxsize=512)
+def classify_license(license_text: str) -> tuple[frozenset[LicenseWarning], str]:
+    """Get the warnings and warning message for license text.
+
+    The same as building a LicenseInfo and reading its warnings and
+    warning_message, cached for callers that re-check text as it's typed.
+    """
+    warnings = LicenseInfo(license_text=license_text).warnings
+    return warnings, _build_warning_message(warnings)
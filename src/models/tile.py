@@ -1,29 +1,27 @@
 """Individual tile data model."""
 
-import hashlib
 from dataclasses import dataclass, field
 from typing import Optional
-from PySide6.QtGui import QImage
-
 
-def compute_image_hash(image: QImage) -> str:
-    """Compute a hash of the image pixel data for deduplication."""
-    if image is None:
-        return ""
+import xxhash
+from PySide6.QtGui import QImage
 
-    # Convert to consistent format
-    img = image.convertToFormat(QImage.Format.Format_RGBA8888)
 
-    # Get raw pixel data
-    ptr = img.bits()
-    if ptr is None:
-        return ""
+def hash_rgba8888_image(image: QImage) -> int:
+    """Hash an image that is already in RGBA8888 format."""
+    # Get raw pixel data as a read-only view (constBits never detaches,
+    # and the hasher reads the buffer in place without a bytes() copy)
+    data = image.constBits()
+    if data is None:
+        return 0
 
-    data = bytes(ptr)
-    return hashlib.sha256(data).hexdigest()
+    # Non-cryptographic 128-bit hash: only used for in-memory deduplication.
+    # Kept as an int, which is cheaper to hash and compare as a dict key
+    # than a hex string
+    return xxhash.xxh3_128_intdigest(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Represents an individual tile extracted from a tileset."""
 
@@ -40,15 +38,16 @@ class Tile:
     # Naming - None means unlabeled (won't be exported)
     custom_name: Optional[str] = None
 
-    # Deduplication - hash of pixel data
-    _image_hash: str = field(default="", repr=False)
+    # Deduplication - hash of pixel data (0 until computed)
+    _image_hash: int = field(default=0, repr=False)
 
     # Group ID for duplicate tiles (all duplicates share same group_id)
     # The group_id is the index of the first tile with this hash
     duplicate_group_id: Optional[int] = None
 
-    # Cached image data (not serialized)
-    _image: Optional[QImage] = field(default=None, repr=False, compare=False)
+    # RGBA8888 source image the tile is cut from (not serialized). Tile
+    # pixels are not cached; they are copied out of the source when needed
+    _source: Optional[QImage] = field(default=None, repr=False, compare=False)
 
     @property
     def name(self) -> str:
@@ -75,21 +74,39 @@ class Tile:
 
     @property
     def image(self) -> Optional[QImage]:
-        """Get the cached tile image."""
-        return self._image
-
-    @image.setter
-    def image(self, value: QImage) -> None:
-        """Set the cached tile image and compute hash."""
-        self._image = value
-        if value is not None:
-            self._image_hash = compute_image_hash(value)
-        else:
-            self._image_hash = ""
+        """Get the tile image, copied from the source on each access."""
+        if self._source is None:
+            return None
+        return self.render(self._source)
+
+    def render(self, source_image: QImage) -> QImage:
+        """Copy this tile's rect out of a source image."""
+        return source_image.copy(self.pixel_x, self.pixel_y, self.width, self.height)
+
+    @property
+    def pixels_key(self) -> str:
+        """Key identifying the tile's pixels, for caching images made from them.
+
+        Empty if the tile has no source image.
+        """
+        if self._source is None:
+            return ""
+        return (
+            f"{self._source.cacheKey()}:{self.pixel_x},{self.pixel_y}:"
+            f"{self.width}x{self.height}"
+        )
+
+    def set_source(self, source: QImage) -> None:
+        """Set the RGBA8888 source image the tile's pixels come from."""
+        self._source = source
+        self._image_hash = 0
 
     @property
-    def image_hash(self) -> str:
-        """Get the image hash for deduplication."""
+    def image_hash(self) -> int:
+        """Get the image hash for deduplication (computed on first access)."""
+        if not self._image_hash and self._source is not None:
+            # Tiles cut from the source are already RGBA8888
+            self._image_hash = hash_rgba8888_image(self.image)
         return self._image_hash
 
     def get_filename(self, extension: str) -> str:
@@ -10,7 +10,7 @@ from .tile import Tile
 from .license_info import LicenseInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class GridSettings:
     """Settings for the tile grid overlay."""
 
@@ -63,13 +63,31 @@ class Tileset:
         self._image: Optional[QImage] = None
 
         # Grid configuration
-        self.grid_settings = grid_settings or GridSettings()
+        self._grid_settings = grid_settings or GridSettings()
+
+        # Cached (columns, rows), cleared when the image or grid settings change
+        self._grid_size: Optional[tuple[int, int]] = None
 
         # Extracted tiles
         self.tiles: list[Tile] = []
 
         # Duplicate groups: hash -> list of tile indices
-        self._duplicate_groups: dict[str, list[int]] = {}
+        self._duplicate_groups: dict[int, list[int]] = {}
+
+        # Duplicate counts: group id -> number of tiles in the group
+        self._duplicate_counts: dict[int, int] = {}
+
+        # Whether tiles have been hashed into the duplicate groups yet
+        self._duplicates_built: bool = False
+
+        # Grid position lookup: (col, row) -> tile index
+        self._grid_index: dict[tuple[int, int], int] = {}
+
+        # Indices of labeled tiles, kept up to date by set_tile_name
+        self._labeled_indices: set[int] = set()
+
+        # Bumped whenever tiles are regenerated or renamed
+        self._version: int = 0
 
         # Naming
         self.set_name: str = ""
@@ -89,9 +107,26 @@ class Tileset:
     def image(self, value: QImage) -> None:
         """Set the source image and regenerate tiles."""
         self._image = value
+        self._grid_size = None
         if value is not None:
             self._generate_tiles()
 
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the tiles or their names do."""
+        return self._version
+
+    @property
+    def grid_settings(self) -> GridSettings:
+        """Get the grid settings."""
+        return self._grid_settings
+
+    @grid_settings.setter
+    def grid_settings(self, value: GridSettings) -> None:
+        """Set the grid settings (call regenerate_tiles to apply them)."""
+        self._grid_settings = value
+        self._grid_size = None
+
     @property
     def selected_tile(self) -> Optional[Tile]:
         """Get the currently selected tile."""
@@ -105,6 +140,8 @@ class Tileset:
         if self.selected_tile_index is None:
             return []
 
+        self.ensure_duplicate_groups()
+
         tile = self.selected_tile
         if tile is None:
             return []
@@ -118,6 +155,21 @@ class Tileset:
     @property
     def grid_columns(self) -> int:
         """Calculate number of columns in the grid."""
+        return self._get_grid_size()[0]
+
+    @property
+    def grid_rows(self) -> int:
+        """Calculate number of rows in the grid."""
+        return self._get_grid_size()[1]
+
+    def _get_grid_size(self) -> tuple[int, int]:
+        """Get the cached (columns, rows), computing them on first call."""
+        if self._grid_size is None:
+            self._grid_size = (self._compute_grid_columns(), self._compute_grid_rows())
+        return self._grid_size
+
+    def _compute_grid_columns(self) -> int:
+        """Calculate how many tile columns fit in the image."""
         if self._image is None:
             return 0
         gs = self.grid_settings
@@ -130,9 +182,8 @@ class Tileset:
             return 0
         return max(0, (available_width + gs.separator_x) // step)
 
-    @property
-    def grid_rows(self) -> int:
-        """Calculate number of rows in the grid."""
+    def _compute_grid_rows(self) -> int:
+        """Calculate how many tile rows fit in the image."""
         if self._image is None:
             return 0
         gs = self.grid_settings
@@ -152,24 +203,36 @@ class Tileset:
     @property
     def labeled_count(self) -> int:
         """Get number of labeled tiles."""
-        return sum(1 for t in self.tiles if t.is_labeled)
+        return len(self._labeled_indices)
 
     @property
     def unique_tile_count(self) -> int:
         """Get number of unique tiles (after deduplication)."""
+        self.ensure_duplicate_groups()
         return len(self._duplicate_groups)
 
     def _generate_tiles(self) -> None:
         """Generate tile objects based on current grid settings."""
+        self._version += 1
         if self._image is None:
             self.tiles = []
             self._duplicate_groups = {}
+            self._duplicate_counts = {}
+            self._duplicates_built = False
+            self._grid_index = {}
+            self._labeled_indices = set()
             return
 
         gs = self.grid_settings
         cols = self.grid_columns
         rows = self.grid_rows
 
+        # Convert the source once so every tile is cut out already in the
+        # format that hashing and export use, instead of converting per tile.
+        # Tiles only keep their rect here; pixels are copied and hashed on
+        # first use (see ensure_duplicate_groups)
+        source = self._image.convertToFormat(QImage.Format.Format_RGBA8888)
+
         # Preserve existing custom names where possible (by grid position)
         old_names: dict[tuple[int, int], str] = {}
         for tile in self.tiles:
@@ -178,6 +241,10 @@ class Tileset:
 
         self.tiles = []
         self._duplicate_groups = {}
+        self._duplicate_counts = {}
+        self._duplicates_built = False
+        self._grid_index = {}
+        self._labeled_indices = set()
 
         for row in range(rows):
             for col in range(cols):
@@ -201,31 +268,36 @@ class Tileset:
                     custom_name=old_names.get((col, row)),
                 )
 
-                # Extract tile image (this also computes the hash)
-                tile.image = self._image.copy(
-                    pixel_x, pixel_y, gs.tile_width, gs.tile_height
-                )
+                tile.set_source(source)
 
                 tile_index = len(self.tiles)
                 self.tiles.append(tile)
-
-                # Track duplicate groups
-                if tile.image_hash:
-                    if tile.image_hash not in self._duplicate_groups:
-                        self._duplicate_groups[tile.image_hash] = []
-                    self._duplicate_groups[tile.image_hash].append(tile_index)
-
-        # Assign duplicate group IDs (index of first tile with this hash)
-        for hash_val, indices in self._duplicate_groups.items():
-            group_id = indices[0]
-            for idx in indices:
-                self.tiles[idx].duplicate_group_id = group_id
+                self._grid_index[(col, row)] = tile_index
+                if tile.is_labeled:
+                    self._labeled_indices.add(tile_index)
 
         # Clear selection if it's now invalid
         if self.selected_tile_index is not None:
             if self.selected_tile_index >= len(self.tiles):
                 self.selected_tile_index = None
 
+    def ensure_duplicate_groups(self) -> None:
+        """Hash the tiles and build duplicate groups if not done yet."""
+        if self._duplicates_built:
+            return
+
+        for tile_index, tile in enumerate(self.tiles):
+            # Track duplicate groups; the group ID is the index of the
+            # first tile with this hash
+            if tile.image_hash:
+                group = self._duplicate_groups.setdefault(tile.image_hash, [])
+                group_id = group[0] if group else tile_index
+                group.append(tile_index)
+                tile.duplicate_group_id = group_id
+                self._duplicate_counts[group_id] = len(group)
+
+        self._duplicates_built = True
+
     def regenerate_tiles(self) -> None:
         """Public method to regenerate tiles after grid settings change."""
         self._generate_tiles()
@@ -263,22 +335,19 @@ class Tileset:
             return None
 
         # Find the tile at this grid position
-        for i, tile in enumerate(self.tiles):
-            if tile.grid_x == col and tile.grid_y == row:
-                self.selected_tile_index = i
-                return i
-
-        return None
+        index = self._grid_index.get((col, row))
+        if index is not None:
+            self.selected_tile_index = index
+        return index
 
     def get_tile_by_grid_pos(self, col: int, row: int) -> Optional[Tile]:
         """Get a tile by its grid position."""
-        for tile in self.tiles:
-            if tile.grid_x == col and tile.grid_y == row:
-                return tile
-        return None
+        index = self._grid_index.get((col, row))
+        return self.tiles[index] if index is not None else None
 
     def get_duplicate_tiles(self, tile: Tile) -> list[Tile]:
         """Get all tiles that are duplicates of the given tile."""
+        self.ensure_duplicate_groups()
         if not tile.image_hash or tile.image_hash not in self._duplicate_groups:
             return [tile]
 
@@ -287,9 +356,10 @@ class Tileset:
 
     def get_duplicate_count(self, tile: Tile) -> int:
         """Get the number of duplicates for a tile (including itself)."""
-        if not tile.image_hash or tile.image_hash not in self._duplicate_groups:
+        self.ensure_duplicate_groups()
+        if tile.duplicate_group_id is None:
             return 1
-        return len(self._duplicate_groups[tile.image_hash])
+        return self._duplicate_counts.get(tile.duplicate_group_id, 1)
 
     def set_name_for_duplicates(self, tile: Tile, name: str) -> list[Tile]:
         """Set the name for a tile and all its duplicates.
@@ -298,28 +368,51 @@ class Tileset:
         """
         duplicates = self.get_duplicate_tiles(tile)
         for dup in duplicates:
-            dup.name = name
+            self.set_tile_name(dup, name)
         return duplicates
 
+    def set_tile_name(self, tile: Tile, name: Optional[str]) -> None:
+        """Set a tile's name, keeping the labeled count up to date.
+
+        Tiles of this tileset should be renamed through here rather than
+        by assigning tile.name directly.
+        """
+        tile.name = name
+        self._version += 1
+
+        # Tiles from before the last regeneration (e.g. renamed by undo)
+        # aren't part of this grid anymore
+        index = self._grid_index.get((tile.grid_x, tile.grid_y))
+        if index is None or self.tiles[index] is not tile:
+            return
+
+        if tile.is_labeled:
+            self._labeled_indices.add(index)
+        else:
+            self._labeled_indices.discard(index)
+
     def get_exportable_tiles(self) -> list[Tile]:
         """Get tiles that are labeled and ready for export.
 
         Only returns one tile per duplicate group.
         """
-        exported_hashes: set[str] = set()
+        self.ensure_duplicate_groups()
+        exported_groups: set[int] = set()
         exportable: list[Tile] = []
 
-        for tile in self.tiles:
-            if not tile.is_labeled:
-                continue
+        # Only labeled tiles are visited, in grid order
+        for index in sorted(self._labeled_indices):
+            tile = self.tiles[index]
+            group_id = tile.duplicate_group_id
+            if group_id is None:
+                group_id = index
 
-            # Skip if we've already included a tile with this hash
-            if tile.image_hash and tile.image_hash in exported_hashes:
+            # Skip if we've already included a tile from this group
+            if group_id in exported_groups:
                 continue
 
             exportable.append(tile)
-            if tile.image_hash:
-                exported_hashes.add(tile.image_hash)
+            exported_groups.add(group_id)
 
         return exportable
 
@@ -0,0 +1,6 @@
+"""Compiled Qt resources for Tile Splitter.
+
+Regenerate ``resources_rc.py`` after editing anything under this folder:
+
+    pyside6-rcc --no-compress src/resources/resources.qrc -o src/resources/resources_rc.py
+"""
@@ -0,0 +1,146 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x06\xa4\
+Q\
+ToolTip {\x0a    ba\
+ckground-color: \
+#232323;\x0a    col\
+or: #cccccc;\x0a   \
+ border: 1px sol\
+id #555555;\x0a    \
+padding: 4px;\x0a}\x0a\
+\x0aQGroupBox {\x0a   \
+ border: 1px sol\
+id #555555;\x0a    \
+border-radius: 4\
+px;\x0a    margin-t\
+op: 8px;\x0a    pad\
+ding-top: 8px;\x0a}\
+\x0a\x0aQGroupBox::tit\
+le {\x0a    subcont\
+rol-origin: marg\
+in;\x0a    subcontr\
+ol-position: top\
+ left;\x0a    left:\
+ 8px;\x0a    paddin\
+g: 0 4px;\x0a}\x0a\x0aQLi\
+neEdit, QSpinBox\
+, QComboBox {\x0a  \
+  background-col\
+or: #2a2a2a;\x0a   \
+ border: 1px sol\
+id #555555;\x0a    \
+border-radius: 3\
+px;\x0a    padding:\
+ 4px;\x0a}\x0a\x0aQLineEd\
+it:focus, QSpinB\
+ox:focus, QCombo\
+Box:focus {\x0a    \
+border-color: #4\
+682b4;\x0a}\x0a\x0aQPushB\
+utton {\x0a    back\
+ground-color: #3\
+a3a3a;\x0a    borde\
+r: 1px solid #55\
+5555;\x0a    border\
+-radius: 3px;\x0a  \
+  padding: 6px 1\
+2px;\x0a}\x0a\x0aQPushBut\
+ton:hover {\x0a    \
+background-color\
+: #454545;\x0a}\x0a\x0aQP\
+ushButton:presse\
+d {\x0a    backgrou\
+nd-color: #35353\
+5;\x0a}\x0a\x0aQPushButto\
+n:disabled {\x0a   \
+ background-colo\
+r: #2a2a2a;\x0a    \
+color: #666666;\x0a\
+}\x0a\x0aQTableView {\x0a\
+    background-c\
+olor: #2a2a2a;\x0a \
+   gridline-colo\
+r: #404040;\x0a}\x0a\x0aQ\
+HeaderView::sect\
+ion {\x0a    backgr\
+ound-color: #353\
+535;\x0a    border:\
+ 1px solid #4040\
+40;\x0a    padding:\
+ 4px;\x0a}\x0a\x0aQScroll\
+Bar {\x0a    backgr\
+ound-color: #2a2\
+a2a;\x0a}\x0a\x0aQScrollB\
+ar:vertical {\x0a  \
+  width: 12px;\x0a}\
+\x0a\x0aQScrollBar:hor\
+izontal {\x0a    he\
+ight: 12px;\x0a}\x0a\x0aQ\
+ScrollBar::handl\
+e {\x0a    backgrou\
+nd-color: #4a4a4\
+a;\x0a    border-ra\
+dius: 4px;\x0a}\x0a\x0aQS\
+crollBar::handle\
+:hover {\x0a    bac\
+kground-color: #\
+5a5a5a;\x0a}\x0a\x0aQScro\
+llBar::handle:ve\
+rtical {\x0a    min\
+-height: 20px;\x0a}\
+\x0a\x0aQScrollBar::ha\
+ndle:horizontal \
+{\x0a    min-width:\
+ 20px;\x0a}\x0a\x0aQMenuB\
+ar, QMenu {\x0a    \
+background-color\
+: #2d2d2d;\x0a}\x0a\x0aQM\
+enu {\x0a    border\
+: 1px solid #404\
+040;\x0a}\x0a\x0aQMenuBar\
+::item:selected,\
+ QMenu::item:sel\
+ected, QTableVie\
+w::item:selected\
+ {\x0a    backgroun\
+d-color: #4682b4\
+;\x0a}\x0a\x0aQStatusBar \
+{\x0a    background\
+-color: #252525;\
+\x0a}\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00z\xec5\
+\x00t\
+\x00h\x00e\x00m\x00e\
+\x00\x08\
+\x08\x8eU\xe3\
+\x00d\
+\x00a\x00r\x00k\x00.\x00q\x00s\x00s\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1A>\xe9$\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,20 +1,74 @@
 """Image loading service with metadata extraction."""
 
 import re
+import struct
+import xml.etree.ElementTree as ET
+import zlib
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
 from PIL import Image
-from PIL.ExifTags import TAGS
+from PIL.ExifTags import Base
 from PySide6.QtGui import QImage
 
 from ..models import LicenseInfo, LicenseWarning
 from ..utils import SUPPORTED_FORMATS
 
+# XMP patterns, compiled once at import
+_XMP_CC_RE = re.compile(r'https?://creativecommons\.org/licenses/[^"<>\s]+')
+_XMP_CREATOR_RE = re.compile(
+    r"<dc:creator[^>]*>.*?<rdf:li[^>]*>([^<]+)</rdf:li>", re.DOTALL
+)
+_XMP_RIGHTS_RE = re.compile(
+    r"<dc:rights[^>]*>.*?<rdf:li[^>]*>([^<]+)</rdf:li>", re.DOTALL
+)
+_CC_VERSION_RE = re.compile(r"/(\d\.\d)/")
+
+# XMP element names (ElementTree's {namespace}tag form)
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+_DC_RIGHTS = "{http://purl.org/dc/elements/1.1/}rights"
+_RDF_LI = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}li"
+
+# Substrings at least one of which an XMP packet needs for us to use it
+_XMP_MARKERS = (b"creativecommons.org/licenses/", b"creator", b"rights")
+
+# PNG layout: signature, then chunks of length, type, payload and CRC
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_CHUNK_HEADER = struct.Struct(">I4s")
+_PNG_METADATA_CHUNKS = frozenset({b"tEXt", b"zTXt", b"iTXt", b"eXIf"})
+
+# JPEG markers without a length field (TEM and RST0-7), and the prefix of
+# the APP1 segment holding an XMP packet
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xD8)})
+_JPEG_XMP_PREFIX = b"http://ns.adobe.com/xap/1.0/\0"
+
+# Text chunks, EXIF and XMP packet read from an image file
+_Metadata = tuple[dict[str, str], Optional[Image.Exif], bytes]
+
 
 class ImageLoader:
     """Service for loading images and extracting metadata."""
 
+    # Formats whose files can carry each kind of license metadata
+    EXIF_FORMATS = frozenset({"png", "jpg", "jpeg", "webp"})
+    XMP_FORMATS = frozenset({"png", "jpg", "jpeg", "webp", "gif"})
+
+    # Bytes of XMP scanned from where a field first appears, so huge
+    # packets (e.g. Photoshop document ancestors) can't blow up the regexes
+    XMP_SCAN_LIMIT = 65536
+
+    # Largest decompressed PNG text chunk read, guarding against zip bombs
+    PNG_TEXT_LIMIT = 1024 * 1024
+
+    # Files whose license info is kept, oldest dropped first
+    LICENSE_CACHE_SIZE = 512
+
+    def __init__(self):
+        # License info per (path, format, mtime_ns, size), so an edited
+        # file is read again
+        self._license_cache: dict[tuple[str, str, int, int], LicenseInfo] = {}
+
     def load_image(self, path: Path) -> Optional[QImage]:
         """Load an image file and return as QImage.
 
@@ -24,13 +78,11 @@ class ImageLoader:
         Returns:
             QImage if successful, None otherwise.
         """
-        if not path.exists():
-            return None
-
-        suffix = path.suffix.lower().lstrip(".")
-        if suffix not in SUPPORTED_FORMATS:
+        if self.get_format(path) not in SUPPORTED_FORMATS:
             return None
 
+        # A missing or unreadable file yields a null image, so no
+        # separate exists() stat is needed
         image = QImage(str(path))
         if image.isNull():
             return None
@@ -49,39 +101,216 @@ class ImageLoader:
         - EXIF data (Copyright, Artist, etc.)
         - XMP data (various license fields)
 
+        Only metadata is read; pixel data is never decoded.
+
         Args:
             path: Path to the image file.
 
         Returns:
             LicenseInfo with extracted data, or empty with MISSING warning.
         """
+        fmt = self.get_format(path)
+        if fmt not in self.XMP_FORMATS:
+            # No metadata source for this format (e.g. BMP), so don't
+            # open the file at all
+            return LicenseInfo(warnings=frozenset({LicenseWarning.MISSING}))
+
         try:
-            with Image.open(path) as img:
-                info = LicenseInfo()
-
-                # Try PNG text chunks first
-                if hasattr(img, "text") and img.text:
-                    info = self._extract_from_png_text(img.text)
-                    if not info.is_empty():
-                        return info
-
-                # Try EXIF data
-                exif_info = self._extract_from_exif(img)
-                if not exif_info.is_empty():
-                    return exif_info
-
-                # Try XMP data
-                xmp_info = self._extract_from_xmp(img)
-                if not xmp_info.is_empty():
-                    return xmp_info
-
-                # No license found
-                info.warnings = [LicenseWarning.MISSING]
+            stat = path.stat()
+        except OSError:
+            return LicenseInfo(warnings=frozenset({LicenseWarning.MISSING}))
+
+        # Cached per file version; callers get their own copy to modify
+        path_str = str(path)
+        key = (path_str, fmt, stat.st_mtime_ns, stat.st_size)
+        info = self._license_cache.get(key)
+        if info is None:
+            try:
+                info = self._read_license_info(path_str, fmt)
+            except Exception:
+                # Error reading file, return missing. Not cached, since
+                # the error may be temporary (e.g. permissions, or a file
+                # still being written) without changing the file's stat
+                return LicenseInfo(warnings=frozenset({LicenseWarning.MISSING}))
+
+            if len(self._license_cache) >= self.LICENSE_CACHE_SIZE:
+                del self._license_cache[next(iter(self._license_cache))]
+            self._license_cache[key] = info
+        return replace(info)
+
+    def _read_license_info(self, path_str: str, fmt: str) -> LicenseInfo:
+        """Read license metadata from a file.
+
+        Read errors are left to the caller, so they aren't cached.
+        """
+        # PNG and JPEG metadata is read straight from the file's chunks
+        # and segments; other formats (or files whose contents don't
+        # match their extension) go through Pillow
+        metadata = None
+        if fmt == "png":
+            metadata = self._scan_png_metadata(path_str)
+        elif fmt in ("jpg", "jpeg"):
+            metadata = self._scan_jpeg_metadata(path_str)
+        if metadata is None:
+            metadata = self._open_metadata(path_str, fmt)
+        text_chunks, exif_data, xmp_data = metadata
+
+        info = LicenseInfo()
+
+        # Try PNG text chunks first
+        if text_chunks:
+            info = self._extract_from_png_text(text_chunks)
+            if not info.is_empty():
                 return info
 
-        except Exception:
-            # Error reading file, return missing
-            return LicenseInfo(warnings=[LicenseWarning.MISSING])
+        # Try EXIF data
+        exif_info = self._extract_from_exif(exif_data)
+        if not exif_info.is_empty():
+            return exif_info
+
+        # Try XMP data
+        xmp_info = self._extract_from_xmp(xmp_data)
+        if not xmp_info.is_empty():
+            return xmp_info
+
+        # No license found
+        info.warnings = frozenset({LicenseWarning.MISSING})
+        return info
+
+    def _scan_png_metadata(self, path_str: str) -> Optional[_Metadata]:
+        """Read text, EXIF and XMP chunks from a PNG file.
+
+        Pixel data chunks are skipped with a seek rather than read, so text
+        chunks after the image data are still found without decoding it.
+
+        Returns:
+            (text chunks, EXIF, XMP packet), or None if not a PNG file.
+        """
+        text_chunks: dict[str, str] = {}
+        exif_data = None
+        xmp_data = b""
+
+        with open(path_str, "rb") as f:
+            if f.read(8) != _PNG_SIGNATURE:
+                return None
+
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    break
+                length, chunk_type = _PNG_CHUNK_HEADER.unpack(header)
+                if chunk_type == b"IEND":
+                    break
+                if chunk_type not in _PNG_METADATA_CHUNKS:
+                    # Skip the payload and CRC
+                    f.seek(length + 4, 1)
+                    continue
+
+                data = f.read(length)
+                f.seek(4, 1)
+
+                if chunk_type == b"eXIf":
+                    exif_data = self._load_exif(data)
+                    continue
+
+                keyword, _, data = data.partition(b"\0")
+                key = keyword.decode("latin-1")
+                # A corrupt stream or bad UTF-8 skips just that chunk,
+                # as Pillow does
+                try:
+                    if chunk_type == b"tEXt":
+                        value = data.decode("latin-1")
+                    elif chunk_type == b"zTXt":
+                        value = self._inflate_text(data[1:]).decode("latin-1")
+                    else:
+                        # iTXt: compression flag and method, then language
+                        # tag and translated keyword before the UTF-8 text
+                        compressed = data[:1] == b"\1"
+                        _, _, data = data[2:].partition(b"\0")
+                        _, _, data = data.partition(b"\0")
+                        if compressed:
+                            data = self._inflate_text(data)
+                        if key == "XML:com.adobe.xmp":
+                            xmp_data = data
+                        value = data.decode("utf-8")
+                except (UnicodeDecodeError, zlib.error):
+                    continue
+                text_chunks[key] = value
+
+        return text_chunks, exif_data, xmp_data
+
+    def _scan_jpeg_metadata(self, path_str: str) -> Optional[_Metadata]:
+        """Read the EXIF and XMP APP1 segments from a JPEG file.
+
+        Segments are walked up to the start of scan, where the
+        entropy-coded image data begins.
+
+        Returns:
+            (no text chunks, EXIF, XMP packet), or None if not a JPEG file.
+        """
+        exif_data = None
+        xmp_data = b""
+
+        with open(path_str, "rb") as f:
+            if f.read(2) != b"\xff\xd8":
+                return None
+
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    break
+                code = marker[1]
+                if code == 0xFF:
+                    # Fill byte before the actual marker
+                    f.seek(-1, 1)
+                    continue
+                if code in _JPEG_STANDALONE_MARKERS:
+                    continue
+                if code in (0xDA, 0xD9):
+                    # Start of scan / end of image
+                    break
+
+                length_bytes = f.read(2)
+                if len(length_bytes) < 2:
+                    break
+                length = int.from_bytes(length_bytes, "big") - 2
+                if code != 0xE1:
+                    f.seek(length, 1)
+                    continue
+
+                data = f.read(length)
+                if data.startswith(b"Exif\0\0"):
+                    if exif_data is None:
+                        exif_data = self._load_exif(data)
+                elif data.startswith(_JPEG_XMP_PREFIX):
+                    if not xmp_data:
+                        xmp_data = data[len(_JPEG_XMP_PREFIX):]
+
+        return {}, exif_data, xmp_data
+
+    def _open_metadata(self, path_str: str, fmt: str) -> _Metadata:
+        """Read EXIF and XMP metadata with Pillow, for the other formats."""
+        with Image.open(path_str) as img:
+            exif_data = None
+            # PNG only has EXIF at hand if it came before the pixel data;
+            # looking further would make Pillow decode the whole image
+            if fmt in self.EXIF_FORMATS and (
+                img.format != "PNG" or "exif" in img.info
+            ):
+                # getexif() reads just the base IFD, which holds both tags
+                # we use, instead of merging every sub-IFD like _getexif()
+                exif_data = img.getexif()
+            return {}, exif_data, img.info.get("xmp", b"")
+
+    def _load_exif(self, data: bytes) -> Image.Exif:
+        """Parse the base IFD of raw EXIF data."""
+        exif_data = Image.Exif()
+        exif_data.load(data)
+        return exif_data
+
+    def _inflate_text(self, data: bytes) -> bytes:
+        """Decompress a PNG text chunk, bounded by PNG_TEXT_LIMIT."""
+        return zlib.decompressobj().decompress(data, self.PNG_TEXT_LIMIT)
 
     def _extract_from_png_text(self, text_chunks: dict) -> LicenseInfo:
         """Extract license info from PNG text chunks."""
@@ -114,23 +343,19 @@ class ImageLoader:
             source_url=source_url,
         )
 
-    def _extract_from_exif(self, img: Image.Image) -> LicenseInfo:
+    def _extract_from_exif(self, exif_data: Optional[Image.Exif]) -> LicenseInfo:
         """Extract license info from EXIF data."""
         try:
-            exif_data = img._getexif()
             if not exif_data:
                 return LicenseInfo()
 
             license_text = ""
             author = ""
 
-            for tag_id, value in exif_data.items():
-                tag = TAGS.get(tag_id, tag_id)
-
-                if tag == "Copyright":
-                    license_text = str(value)
-                elif tag == "Artist":
-                    author = str(value)
+            if Base.Copyright in exif_data:
+                license_text = str(exif_data[Base.Copyright])
+            if Base.Artist in exif_data:
+                author = str(exif_data[Base.Artist])
 
             return LicenseInfo(
                 license_text=license_text,
@@ -140,50 +365,33 @@ class ImageLoader:
         except (AttributeError, TypeError):
             return LicenseInfo()
 
-    def _extract_from_xmp(self, img: Image.Image) -> LicenseInfo:
-        """Extract license info from XMP metadata."""
+    def _extract_from_xmp(self, xmp_data: bytes) -> LicenseInfo:
+        """Extract license info from an XMP packet."""
         try:
-            xmp_data = img.info.get("xmp", b"")
             if not xmp_data:
                 return LicenseInfo()
 
-            # XMP is XML, do basic string parsing for common fields
-            if isinstance(xmp_data, bytes):
-                xmp_str = xmp_data.decode("utf-8", errors="ignore")
-            else:
-                xmp_str = str(xmp_data)
+            if not isinstance(xmp_data, bytes):
+                xmp_data = str(xmp_data).encode("utf-8")
 
-            license_text = ""
-            license_url = ""
-            author = ""
+            # Skip packets that can't hold any of the fields we read
+            if not any(marker in xmp_data for marker in _XMP_MARKERS):
+                return LicenseInfo()
 
-            # Look for Creative Commons URL
-            cc_match = re.search(
-                r'https?://creativecommons\.org/licenses/[^"<>\s]+',
-                xmp_str
-            )
-            if cc_match:
-                license_url = cc_match.group(0)
+            license_text = ""
+            license_url = self._find_xmp_license_url(xmp_data)
+            if license_url:
                 # Derive license name from URL
                 license_text = self._license_name_from_url(license_url)
 
-            # Look for dc:creator
-            creator_match = re.search(
-                r"<dc:creator[^>]*>.*?<rdf:li[^>]*>([^<]+)</rdf:li>",
-                xmp_str,
-                re.DOTALL
-            )
-            if creator_match:
-                author = creator_match.group(1)
+            # XMP is XML; fall back to string scanning if it's malformed
+            fields = self._parse_xmp_fields(xmp_data)
+            if fields is None:
+                fields = self._scan_xmp_fields(xmp_data)
+            author, rights = fields
 
-            # Look for dc:rights
-            rights_match = re.search(
-                r"<dc:rights[^>]*>.*?<rdf:li[^>]*>([^<]+)</rdf:li>",
-                xmp_str,
-                re.DOTALL
-            )
-            if rights_match and not license_text:
-                license_text = rights_match.group(1)
+            if not license_text:
+                license_text = rights
 
             return LicenseInfo(
                 license_text=license_text,
@@ -194,6 +402,85 @@ class ImageLoader:
         except Exception:
             return LicenseInfo()
 
+    def _find_xmp_license_url(self, xmp_data: bytes) -> str:
+        """Find a Creative Commons license URL anywhere in an XMP packet."""
+        # The URL can be an attribute or element text in several
+        # namespaces, so look for it textually (window includes the scheme)
+        cc_window = self._xmp_window(
+            xmp_data, b"creativecommons.org/licenses/", len(b"https://")
+        )
+        if cc_window:
+            cc_match = _XMP_CC_RE.search(cc_window)
+            if cc_match:
+                return cc_match.group(0)
+        return ""
+
+    def _parse_xmp_fields(self, xmp_data: bytes) -> Optional[tuple[str, str]]:
+        """Get the first dc:creator and dc:rights entries from an XMP packet.
+
+        The packet is parsed and searched in C (ElementTree), so the cost
+        stays linear however many other list items the packet holds.
+
+        Returns:
+            (author, rights), or None if the XMP isn't well-formed XML.
+        """
+        try:
+            root = ET.fromstring(xmp_data)
+        except ET.ParseError:
+            return None
+
+        return (
+            self._first_xmp_item(root, _DC_CREATOR),
+            self._first_xmp_item(root, _DC_RIGHTS),
+        )
+
+    def _first_xmp_item(self, root: ET.Element, tag: str) -> str:
+        """Get the text of the first rdf:li inside the first tag element."""
+        elem = next(root.iter(tag), None)
+        if elem is None:
+            return ""
+        for item in elem.iter(_RDF_LI):
+            if item.text:
+                return item.text
+        return ""
+
+    def _scan_xmp_fields(self, xmp_data: bytes) -> tuple[str, str]:
+        """Find the same fields as _parse_xmp_fields with regexes.
+
+        Used for malformed packets. Each regex only runs on a bounded window
+        starting where a plain substring search found its field.
+        """
+        author = ""
+        rights = ""
+
+        # Look for dc:creator
+        creator_window = self._xmp_window(xmp_data, b"<dc:creator")
+        if creator_window:
+            creator_match = _XMP_CREATOR_RE.search(creator_window)
+            if creator_match:
+                author = creator_match.group(1)
+
+        # Look for dc:rights
+        rights_window = self._xmp_window(xmp_data, b"<dc:rights")
+        if rights_window:
+            rights_match = _XMP_RIGHTS_RE.search(rights_window)
+            if rights_match:
+                rights = rights_match.group(1)
+
+        return author, rights
+
+    def _xmp_window(self, xmp_data: bytes, marker: bytes, before: int = 0) -> str:
+        """Decode the part of an XMP packet starting at marker.
+
+        Returns an empty string if the marker doesn't occur at all.
+        """
+        index = xmp_data.find(marker)
+        if index < 0:
+            return ""
+        start = max(0, index - before)
+        window = xmp_data[start:index + self.XMP_SCAN_LIMIT]
+        return window.decode("utf-8", errors="ignore")
+
     def _license_name_from_url(self, url: str) -> str:
         """Convert a Creative Commons URL to a readable name."""
         url_lower = url.lower()
@@ -212,7 +499,7 @@ class ImageLoader:
             parts.append("SA")
 
         # Try to get version
-        version_match = re.search(r"/(\d\.\d)/", url)
+        version_match = _CC_VERSION_RE.search(url)
         if version_match:
             parts.append(version_match.group(1))
 
@@ -1,12 +1,61 @@
 """License extraction service for fetching license info from URLs."""
 
 import re
+import threading
 from typing import Optional
 
-import requests
-
 from ..models import LicenseInfo
 
+try:
+    import re2
+except ImportError:  # Optional; the backtracking re module is used instead
+    re2 = None
+
+
+def _compile_html_pattern(pattern: str, dotall: bool = False):
+    """Compile a case-insensitive pattern that runs on fetched pages.
+
+    RE2 is used when installed: it matches in linear time, so patterns
+    with lazy gaps can't backtrack catastrophically on hostile pages.
+    """
+    if re2 is not None:
+        return re2.compile(("(?is)" if dotall else "(?i)") + pattern)
+    return re.compile(pattern, re.IGNORECASE | (re.DOTALL if dotall else 0))
+
+
+# Compiled once at import; these run on every fetched page
+_TAG_RE = re.compile(r"<[^>]+>")
+_CC_HREF_RE = _compile_html_pattern(
+    r'href=["\']?(https?://creativecommons\.org/[^"\'\s>]+)'
+)
+_REL_LICENSE_RE = _compile_html_pattern(
+    r'<a[^>]*rel=["\']license["\'][^>]*href=["\']([^"\']+)["\']'
+)
+_URL_VALID_RE = re.compile(r"https?://", re.IGNORECASE)
+_SLUG_SEPARATOR_RE = re.compile(r" +")
+
+
+class _SlugTable(dict):
+    """str.translate table for slugs, filled in as characters are seen.
+
+    Word characters and hyphens are kept, whitespace and underscores become
+    a space (later joined into one hyphen per run), and the rest is dropped.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if char.isspace() or char == "_":
+            value = " "
+        elif char.isalnum() or char == "-":
+            value = char
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
+
 
 class LicenseExtractor:
     """Service for extracting license information from web pages."""
@@ -14,6 +63,15 @@ class LicenseExtractor:
     # Timeout for HTTP requests
     REQUEST_TIMEOUT = 10
 
+    # Most of a page that is downloaded; license details sit well within
+    # this, and it bounds memory for huge or endless responses
+    MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+    # HTTP session shared by all extractors, so repeated fetches reuse
+    # pooled connections (created on first use)
+    _session = None
+    _session_lock = threading.Lock()
+
     # Common license URL patterns
     LICENSE_URL_PATTERNS = [
         # Creative Commons
@@ -32,28 +90,54 @@ class LicenseExtractor:
         ),
     ]
 
-    # Patterns to find license info in HTML
+    # Patterns to find license info in HTML, each paired with a lowercase
+    # substring the page must contain for the pattern to match at all
     HTML_LICENSE_PATTERNS = [
-        # OpenGameArt license field
-        r'<span class="field-name">License.*?</span>.*?<a[^>]*>([^<]+)</a>',
-        # Generic license link
-        r'license["\s>][^<]*<a[^>]*href="([^"]+)"[^>]*>([^<]+)</a>',
-        # Meta tags
-        r'<meta[^>]*name=["\']?(?:license|rights|dc\.rights)["\']?[^>]*content=["\']([^"\']+)["\']',
-        # Creative Commons badge
-        r'<a[^>]*rel=["\']license["\'][^>]*href=["\']([^"\']+)["\']',
-        # Plain text after "License:"
-        r'(?:License|Licensed under)[:\s]+([A-Z]{2}[\w\s\-\.]+\d\.\d)',
+        (marker, _compile_html_pattern(pattern, dotall=True))
+        for marker, pattern in (
+            # OpenGameArt license field
+            (
+                '<span class="field-name">license',
+                r'<span class="field-name">License.*?</span>.*?<a[^>]*>([^<]+)</a>',
+            ),
+            # Generic license link
+            (
+                "license",
+                r'license["\s>][^<]*<a[^>]*href="([^"]+)"[^>]*>([^<]+)</a>',
+            ),
+            # Meta tags
+            (
+                "<meta",
+                r'<meta[^>]*name=["\']?(?:license|rights|dc\.rights)["\']?[^>]*content=["\']([^"\']+)["\']',
+            ),
+            # Creative Commons badge
+            (
+                "rel=",
+                r'<a[^>]*rel=["\']license["\'][^>]*href=["\']([^"\']+)["\']',
+            ),
+            # Plain text after "License:"
+            (
+                "license",
+                r'(?:License|Licensed under)[:\s]+([A-Z]{2}[\w\s\-\.]+\d\.\d)',
+            ),
+        )
     ]
 
-    # Patterns to find author info in HTML
+    # Patterns to find author info in HTML, paired like the above ("" for
+    # patterns without a selective substring)
     HTML_AUTHOR_PATTERNS = [
-        # OpenGameArt author
-        r'<span class="username">([^<]+)</span>',
-        r'<a[^>]*class="username"[^>]*>([^<]+)</a>',
-        # Generic author patterns
-        r'(?:Author|Artist|Creator|By)[:\s]+([^<\n]+)',
-        r'<meta[^>]*name=["\']?(?:author|dc\.creator)["\']?[^>]*content=["\']([^"\']+)["\']',
+        (marker, _compile_html_pattern(pattern))
+        for marker, pattern in (
+            # OpenGameArt author
+            ('<span class="username">', r'<span class="username">([^<]+)</span>'),
+            ('class="username"', r'<a[^>]*class="username"[^>]*>([^<]+)</a>'),
+            # Generic author patterns
+            ("", r'(?:Author|Artist|Creator|By)[:\s]+([^<\n]+)'),
+            (
+                "<meta",
+                r'<meta[^>]*name=["\']?(?:author|dc\.creator)["\']?[^>]*content=["\']([^"\']+)["\']',
+            ),
+        )
     ]
 
     def fetch_license_from_url(self, url: str) -> LicenseInfo:
@@ -65,18 +149,23 @@ class LicenseExtractor:
         Returns:
             LicenseInfo with extracted data.
         """
+        # Imported here so startup doesn't pay for requests/urllib3;
+        # main() warms it in a background thread once the window is up
+        import requests
+
         try:
-            response = requests.get(
-                url,
-                timeout=self.REQUEST_TIMEOUT,
-                headers={"User-Agent": "TileSplitter/0.1"}
-            )
-            response.raise_for_status()
-            html = response.text
+            with self._get_session().get(
+                url, timeout=self.REQUEST_TIMEOUT, stream=True
+            ) as response:
+                response.raise_for_status()
+                html = self._read_page(response)
 
-            license_text = self._extract_license_from_html(html)
-            license_url = self._extract_license_url_from_html(html)
-            author = self._extract_author_from_html(html)
+            # Lowercased once so every extractor can skip patterns whose
+            # marker substring isn't on the page
+            html_lower = html.lower()
+            license_text = self._extract_license_from_html(html, html_lower)
+            license_url = self._extract_license_url_from_html(html, html_lower)
+            author = self._extract_author_from_html(html, html_lower)
 
             return LicenseInfo(
                 license_text=license_text,
@@ -88,47 +177,91 @@ class LicenseExtractor:
         except requests.RequestException:
             return LicenseInfo(source_url=url)
 
-    def _extract_license_from_html(self, html: str) -> str:
+    @classmethod
+    def _get_session(cls):
+        """Get the shared HTTP session, creating it on first use."""
+        with cls._session_lock:
+            if cls._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = "TileSplitter/0.1"
+                cls._session = session
+            return cls._session
+
+    def _read_page(self, response) -> str:
+        """Read a streamed response body as text, up to MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=8192):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.MAX_PAGE_BYTES:
+                break
+
+        body = b"".join(chunks)
+        try:
+            return body.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            return body.decode("utf-8", errors="replace")
+
+    def _extract_license_from_html(
+        self, html: str, html_lower: Optional[str] = None
+    ) -> str:
         """Extract license text from HTML content."""
-        for pattern in self.HTML_LICENSE_PATTERNS:
-            match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
+        if html_lower is None:
+            html_lower = html.lower()
+        for marker, pattern in self.HTML_LICENSE_PATTERNS:
+            if marker not in html_lower:
+                continue
+            match = pattern.search(html)
             if match:
                 # Get the most relevant group
                 for group in match.groups():
                     if group and not group.startswith("http"):
                         # Clean up the text
-                        text = re.sub(r"<[^>]+>", "", group)
+                        text = _TAG_RE.sub("", group)
                         text = text.strip()
                         if text and len(text) < 200:  # Sanity check
                             return text
         return ""
 
-    def _extract_license_url_from_html(self, html: str) -> str:
+    def _extract_license_url_from_html(
+        self, html: str, html_lower: Optional[str] = None
+    ) -> str:
         """Extract license URL from HTML content."""
+        if html_lower is None:
+            html_lower = html.lower()
+
         # Look for Creative Commons links
-        cc_match = re.search(
-            r'href=["\']?(https?://creativecommons\.org/[^"\'\s>]+)',
-            html,
-            re.IGNORECASE
-        )
-        if cc_match:
-            return cc_match.group(1)
+        if "creativecommons.org/" in html_lower:
+            cc_match = _CC_HREF_RE.search(html)
+            if cc_match:
+                return cc_match.group(1)
 
         # Look for rel="license" links
-        rel_match = re.search(
-            r'<a[^>]*rel=["\']license["\'][^>]*href=["\']([^"\']+)["\']',
-            html,
-            re.IGNORECASE
-        )
-        if rel_match:
-            return rel_match.group(1)
+        if "rel=" in html_lower:
+            rel_match = _REL_LICENSE_RE.search(html)
+            if rel_match:
+                return rel_match.group(1)
 
         return ""
 
-    def _extract_author_from_html(self, html: str) -> str:
+    def _extract_author_from_html(
+        self, html: str, html_lower: Optional[str] = None
+    ) -> str:
         """Extract author information from HTML content."""
-        for pattern in self.HTML_AUTHOR_PATTERNS:
-            match = re.search(pattern, html, re.IGNORECASE)
+        if html_lower is None:
+            html_lower = html.lower()
+        for marker, pattern in self.HTML_AUTHOR_PATTERNS:
+            if marker not in html_lower:
+                continue
+            match = pattern.search(html)
             if match:
                 author = match.group(1).strip()
                 # Clean up HTML entities
@@ -141,7 +274,7 @@ class LicenseExtractor:
 
     def is_valid_url(self, url: str) -> bool:
         """Check if a string is a valid URL."""
-        return bool(re.match(r"https?://", url, re.IGNORECASE))
+        return bool(_URL_VALID_RE.match(url))
 
     def get_opengameart_url(self, asset_name: str) -> str:
         """Generate an OpenGameArt URL from an asset name.
@@ -150,7 +283,6 @@ class LicenseExtractor:
         OpenGameArt assets.
         """
         # Clean up the name
-        slug = asset_name.lower()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s_]+", "-", slug)
+        slug = asset_name.lower().translate(_SLUG_TABLE)
+        slug = _SLUG_SEPARATOR_RE.sub("-", slug)
         return f"https://opengameart.org/content/{slug}"
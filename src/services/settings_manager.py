@@ -1,5 +1,7 @@
 """Settings manager using QSettings for persistence."""
 
+from collections import deque
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 from PySide6.QtCore import QSettings, QByteArray
@@ -10,9 +12,21 @@ from ..models import GridSettings
 class SettingsManager:
     """Manages persistent application settings."""
 
+    # Number of recent files remembered
+    MAX_RECENT_FILES = 10
+
     def __init__(self):
         self._settings = QSettings("TileSplitter", "TileSplitter")
 
+        # Recent files, most recent first; read once and kept in sync
+        self._recent_files: deque[str] = deque(
+            self._read_recent_files()[:self.MAX_RECENT_FILES],
+            maxlen=self.MAX_RECENT_FILES,
+        )
+
+        # Grid settings as last read or written, to skip QSettings lookups
+        self._grid_cache: Optional[GridSettings] = None
+
     # Output folder
     def get_output_folder(self) -> Optional[Path]:
         """Get the persistent output parent folder."""
@@ -45,17 +59,26 @@ class SettingsManager:
     # Grid settings
     def get_grid_settings(self) -> GridSettings:
         """Get last used grid settings."""
-        return GridSettings(
-            tile_width=int(self._settings.value("grid/tile_width", 32)),
-            tile_height=int(self._settings.value("grid/tile_height", 32)),
-            separator_x=int(self._settings.value("grid/separator_x", 0)),
-            separator_y=int(self._settings.value("grid/separator_y", 0)),
-            offset_x=int(self._settings.value("grid/offset_x", 0)),
-            offset_y=int(self._settings.value("grid/offset_y", 0)),
-        )
+        if self._grid_cache is None:
+            settings = self._settings
+            settings.beginGroup("grid")
+            try:
+                self._grid_cache = GridSettings(
+                    tile_width=settings.value("tile_width", 32, type=int),
+                    tile_height=settings.value("tile_height", 32, type=int),
+                    separator_x=settings.value("separator_x", 0, type=int),
+                    separator_y=settings.value("separator_y", 0, type=int),
+                    offset_x=settings.value("offset_x", 0, type=int),
+                    offset_y=settings.value("offset_y", 0, type=int),
+                )
+            finally:
+                settings.endGroup()
+        # Hand out a copy so callers can't modify the cached settings
+        return replace(self._grid_cache)
 
     def set_grid_settings(self, settings: GridSettings) -> None:
         """Save grid settings."""
+        self._grid_cache = replace(settings)
         self._settings.setValue("grid/tile_width", settings.tile_width)
         self._settings.setValue("grid/tile_height", settings.tile_height)
         self._settings.setValue("grid/separator_x", settings.separator_x)
@@ -66,6 +89,10 @@ class SettingsManager:
     # Recent files
     def get_recent_files(self) -> list[str]:
         """Get list of recently opened files."""
+        return list(self._recent_files)
+
+    def _read_recent_files(self) -> list[str]:
+        """Read the stored recent files list."""
         files = self._settings.value("recent_files", [])
         if files is None:
             return []
@@ -75,23 +102,22 @@ class SettingsManager:
 
     def add_recent_file(self, path: Path) -> None:
         """Add a file to the recent files list."""
-        files = self.get_recent_files()
         path_str = str(path)
 
         # Remove if already in list
-        if path_str in files:
-            files.remove(path_str)
-
-        # Add to front
-        files.insert(0, path_str)
+        try:
+            self._recent_files.remove(path_str)
+        except ValueError:
+            pass
 
-        # Keep only last 10
-        files = files[:10]
+        # Add to front; the deque drops the oldest entry past the limit
+        self._recent_files.appendleft(path_str)
 
-        self._settings.setValue("recent_files", files)
+        self._settings.setValue("recent_files", list(self._recent_files))
 
     def clear_recent_files(self) -> None:
         """Clear the recent files list."""
+        self._recent_files.clear()
         self._settings.setValue("recent_files", [])
 
     # Export format
@@ -11,7 +11,7 @@ SUPPORTED_FORMATS = {
 }
 
 # Formats that support metadata embedding
-METADATA_FORMATS = {"png", "webp"}
+METADATA_FORMATS = frozenset({"png", "webp"})
 
 # Format groups for file dialogs
 FORMAT_GROUPS = {
@@ -23,6 +23,14 @@ FORMAT_GROUPS = {
     "webp": ("WebP Images", "*.webp"),
 }
 
+# Normalized extension for the common spellings of supported formats
+# (lower/upper case, with or without dot), so lookups skip normalizing
+_CANON_EXT = {
+    spelling: "jpg" if ext == "jpeg" else ext
+    for ext in SUPPORTED_FORMATS
+    for spelling in (ext, f".{ext}", ext.upper(), f".{ext.upper()}")
+}
+
 
 def get_format_filter(include_all: bool = True) -> str:
     """Get a filter string for file dialogs.
@@ -63,7 +71,9 @@ def can_embed_metadata(format_ext: str) -> bool:
     Returns:
         True if format supports embedded metadata.
     """
-    ext = format_ext.lower().lstrip(".")
+    ext = _CANON_EXT.get(format_ext)
+    if ext is None:
+        ext = format_ext.lower().lstrip(".")
     return ext in METADATA_FORMATS
 
 
@@ -76,6 +86,9 @@ def normalize_format(format_ext: str) -> str:
     Returns:
         Normalized extension without dot.
     """
+    ext = _CANON_EXT.get(format_ext)
+    if ext is not None:
+        return ext
     ext = format_ext.lower().lstrip(".")
     if ext == "jpeg":
         return "jpg"
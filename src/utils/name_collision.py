@@ -1,14 +1,27 @@
 """Name collision resolution utilities."""
 
+import os
 import re
 from pathlib import Path
-from typing import Set
+from typing import Dict, Optional, Set
+
+# Characters not allowed in filenames (on Windows, the strictest target).
+# A regex class beats a str.translate table on typical set names
+_INVALID_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Reserved device names on Windows
+_WINDOWS_RESERVED = frozenset({
+    "CON", "PRN", "AUX", "NUL",
+    "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
+    "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
+})
 
 
 def resolve_collision(
     base_name: str,
     used_names: Set[str],
     extension: str,
+    next_suffixes: Optional[Dict[str, int]] = None,
 ) -> str:
     """Resolve a name collision by appending a numeric suffix.
 
@@ -16,6 +29,10 @@ def resolve_collision(
         base_name: The desired name (without extension).
         used_names: Set of already used filenames (with extension).
         extension: File extension (without dot).
+        next_suffixes: Optional map of base name to the first suffix worth
+            trying, updated in place. Pass the same dict for a series of
+            calls that only ever add to used_names, so repeated collisions
+            on one name don't probe the taken suffixes again.
 
     Returns:
         A unique filename (with extension).
@@ -25,17 +42,19 @@ def resolve_collision(
     if filename not in used_names:
         return filename
 
-    # Try appending _1, _2, etc.
-    counter = 1
-    while True:
-        new_filename = f"{base_name}_{counter}.{extension}"
+    # Try appending _1, _2, etc., up to a safety limit
+    prefix = f"{base_name}_"
+    suffix = f".{extension}"
+    start = next_suffixes.get(base_name, 1) if next_suffixes is not None else 1
+    for counter in range(start, 10001):
+        new_filename = f"{prefix}{counter}{suffix}"
         if new_filename not in used_names:
+            if next_suffixes is not None:
+                # The suffixes below stay taken, and this one is about to be
+                next_suffixes[base_name] = counter + 1
             return new_filename
-        counter += 1
 
-        # Safety limit
-        if counter > 10000:
-            raise ValueError(f"Could not resolve collision for {base_name}")
+    raise ValueError(f"Could not resolve collision for {base_name}")
 
 
 def find_next_set_index(output_folder: Path, prefix: str = "tileset") -> int:
@@ -51,25 +70,38 @@ def find_next_set_index(output_folder: Path, prefix: str = "tileset") -> int:
     Returns:
         Next available zero-based index.
     """
-    if not output_folder.exists():
-        return 0
+    # Scanned every time rather than cached on the folder's modification
+    # time, which filesystems with coarse timestamps (e.g. FAT) can leave
+    # unchanged when a folder is added
+    return _scan_max_index(str(output_folder), prefix) + 1
+
 
-    # Pattern to match tileset_0, tileset_1, etc.
-    pattern = re.compile(rf"^{re.escape(prefix)}_(\d+)$")
+def _scan_max_index(folder: str, prefix: str) -> int:
+    """Get the highest {prefix}_{i} folder index in a folder, or -1.
 
+    The folder is listed once; a missing or unreadable folder gives -1.
+    """
+    # Folders are named tileset_0, tileset_1, etc.
+    needle = f"{prefix}_"
+    start = len(needle)
     max_index = -1
 
+    # scandir entries know their type from the directory listing, so only
+    # names that match need an is_dir() check, and that rarely stats
     try:
-        for item in output_folder.iterdir():
-            if item.is_dir():
-                match = pattern.match(item.name)
-                if match:
-                    index = int(match.group(1))
-                    max_index = max(max_index, index)
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(needle):
+                    continue
+                # isdecimal() accepts exactly the digits int() parses
+                suffix = name[start:]
+                if suffix.isdecimal() and entry.is_dir():
+                    max_index = max(max_index, int(suffix))
     except OSError:
         pass
 
-    return max_index + 1
+    return max_index
 
 
 def generate_default_set_name(output_folder: Path, prefix: str = "tileset") -> str:
@@ -99,18 +131,11 @@ def is_valid_filename(name: str) -> bool:
         return False
 
     # Check for invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        if char in name:
-            return False
+    if _INVALID_RE.search(name):
+        return False
 
     # Check for reserved names on Windows
-    reserved = {
-        "CON", "PRN", "AUX", "NUL",
-        "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
-        "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
-    }
-    if name.upper() in reserved:
+    if name.upper() in _WINDOWS_RESERVED:
         return False
 
     # Check for names ending in space or period
@@ -130,10 +155,7 @@ def sanitize_filename(name: str) -> str:
         Sanitized filename.
     """
     # Replace invalid characters with underscore
-    invalid_chars = '<>:"/\\|?*'
-    result = name
-    for char in invalid_chars:
-        result = result.replace(char, "_")
+    result = _INVALID_RE.sub("_", name)
 
     # Remove trailing spaces and periods
     result = result.rstrip(" .")
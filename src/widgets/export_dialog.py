@@ -1,14 +1,15 @@
 """Export dialog for previewing and approving tile export."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QComboBox,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView,
     QDialogButtonBox, QGroupBox, QFileDialog,
     QMessageBox, QAbstractItemView, QWidget,
 )
@@ -21,6 +22,73 @@ from ..utils import (
 )
 
 
+class _PreviewModel(QAbstractTableModel):
+    """Table model over the export preview rows.
+
+    Views only ask for the cells they show, so no per-cell items exist.
+    """
+
+    HEADERS = ("Tile", "Filename", "Full Path")
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+
+        # Tile position, filename and full path for each row
+        self._rows: list[tuple[str, str, str]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows: list[tuple[str, str, str]]) -> None:
+        """Replace the rows, telling views only about what changed."""
+        old_rows = self._rows
+        old_count = len(old_rows)
+        new_count = len(rows)
+
+        # Span of changed rows among those kept
+        changed = [
+            i for i in range(min(old_count, new_count)) if old_rows[i] != rows[i]
+        ]
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows = rows
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows = rows
+            self.endInsertRows()
+        else:
+            self._rows = rows
+
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+            )
+
+
 class ExportDialog(QDialog):
     """Dialog for previewing and confirming tile export."""
 
@@ -34,9 +102,19 @@ class ExportDialog(QDialog):
 
         self._tileset = tileset
         self._output_folder = output_folder
+        self._output_folder_str = str(output_folder)
         self._exporter = TileExporter()
         self._export_format: Optional[str] = None
 
+        # Preview update timer, so typing a set name rebuilds it only once
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)  # 150ms debounce
+        self._preview_timer.timeout.connect(self._do_update_preview)
+
+        # Inputs the current preview was built from (None if not shown)
+        self._last_preview_key: Optional[tuple] = None
+
         self._setup_ui()
         self._populate()
 
@@ -55,7 +133,7 @@ class ExportDialog(QDialog):
         folder_layout = QHBoxLayout()
         self._folder_edit = QLineEdit()
         self._folder_edit.setReadOnly(True)
-        self._folder_edit.setText(str(self._output_folder))
+        self._folder_edit.setText(self._output_folder_str)
         folder_layout.addWidget(self._folder_edit)
 
         self._folder_btn = QPushButton("Browse...")
@@ -86,9 +164,9 @@ class ExportDialog(QDialog):
         preview_group = QGroupBox("Files to Export")
         preview_layout = QVBoxLayout(preview_group)
 
-        self._preview_table = QTableWidget()
-        self._preview_table.setColumnCount(3)
-        self._preview_table.setHorizontalHeaderLabels(["Tile", "Filename", "Full Path"])
+        self._preview_model = _PreviewModel(self)
+        self._preview_table = QTableView()
+        self._preview_table.setModel(self._preview_model)
         self._preview_table.horizontalHeader().setSectionResizeMode(
             0, QHeaderView.ResizeMode.ResizeToContents
         )
@@ -141,8 +219,9 @@ class ExportDialog(QDialog):
         if self._tileset.set_name:
             self._set_name_edit.setText(self._tileset.set_name)
         else:
-            default_name = generate_default_set_name(self._output_folder)
-            self._set_name_edit.setText(default_name)
+            # Finding a free name scans the output folder, so it's done
+            # once the dialog is up
+            QTimer.singleShot(0, self._fill_default_set_name)
 
         # License
         license_info = self._tileset.license_info
@@ -164,17 +243,29 @@ class ExportDialog(QDialog):
             else:
                 self._license_label.setStyleSheet("color: #88ff88;")
 
-        self._update_preview()
+        self._do_update_preview()
+
+    def _fill_default_set_name(self) -> None:
+        """Fill in the default set name, unless one was typed already."""
+        if self._set_name_edit.isModified() or self._set_name_edit.text():
+            return
+
+        self._set_name_edit.setText(generate_default_set_name(self._output_folder))
+
+        # Show its preview right away rather than after the debounce
+        self._preview_timer.stop()
+        self._do_update_preview()
 
     def _browse_folder(self) -> None:
         """Browse for output folder."""
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Output Folder",
-            str(self._output_folder),
+            self._output_folder_str,
         )
         if folder:
             self._output_folder = Path(folder)
+            self._output_folder_str = str(self._output_folder)
             self._folder_edit.setText(folder)
             self._update_preview()
 
@@ -183,20 +274,32 @@ class ExportDialog(QDialog):
         return self._format_combo.currentData()
 
     def _update_preview(self) -> None:
+        """Schedule a preview update (debounced)."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self) -> None:
         """Update the preview table."""
         set_name = self._set_name_edit.text().strip()
 
         # Validate set name
         if not set_name:
+            self._last_preview_key = None
             self._export_btn.setEnabled(False)
             self._summary_label.setText("Please enter a set name.")
             return
 
         if not is_valid_filename(set_name):
+            self._last_preview_key = None
             self._export_btn.setEnabled(False)
             self._summary_label.setText("Invalid set name. Please remove special characters.")
             return
 
+        # Nothing to do if the preview already shows these inputs
+        export_format = self._get_export_format()
+        key = (set_name, export_format, self._output_folder_str, self._tileset.version)
+        if key == self._last_preview_key:
+            return
+
         # Update tileset set_name temporarily for preview
         self._tileset.set_name = set_name
 
@@ -204,34 +307,38 @@ class ExportDialog(QDialog):
         preview = self._exporter.preview_export(
             self._tileset,
             self._output_folder,
-            self._get_export_format(),
+            export_format,
         )
 
-        # Update table
-        self._preview_table.setRowCount(len(preview))
-
-        for i, item in enumerate(preview):
-            # Tile position
-            tile = item["tile"]
-            pos_item = QTableWidgetItem(f"({tile.grid_x}, {tile.grid_y})")
-            self._preview_table.setItem(i, 0, pos_item)
-
-            # Filename
-            filename_item = QTableWidgetItem(item["filename"])
-            self._preview_table.setItem(i, 1, filename_item)
-
-            # Full path
-            path_item = QTableWidgetItem(item["path"])
-            self._preview_table.setItem(i, 2, path_item)
+        # Tile position, filename and full path for each row
+        rows = [
+            (
+                f"({item['tile'].grid_x}, {item['tile'].grid_y})",
+                item["filename"],
+                item["path"],
+            )
+            for item in preview
+        ]
+        self._preview_model.set_rows(rows)
 
         # Update summary
         self._summary_label.setText(
-            f"{len(preview)} tiles will be exported to: {self._output_folder / set_name}"
+            f"{len(preview)} tiles will be exported to: "
+            f"{os.path.join(self._output_folder_str, set_name)}"
         )
         self._export_btn.setEnabled(len(preview) > 0)
+        self._last_preview_key = key
 
     def _do_export(self) -> None:
         """Perform the export."""
+        # Apply a pending preview update first, so a set name typed just
+        # before exporting is still validated
+        if self._preview_timer.isActive():
+            self._preview_timer.stop()
+            self._do_update_preview()
+            if not self._export_btn.isEnabled():
+                return
+
         set_name = self._set_name_edit.text().strip()
         self._tileset.set_name = set_name
 
@@ -1,8 +1,9 @@
 """Grid settings widget for configuring tile grid overlay."""
 
+from dataclasses import replace
 from typing import Optional
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QSpinBox, QGroupBox, QCheckBox, QPushButton, QLabel,
@@ -22,8 +23,8 @@ class GridSettingsWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
-        self._settings = GridSettings()
-        self._block_signals = False
+        # Settings read from the spinboxes, cleared whenever one changes
+        self._settings: Optional[GridSettings] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -136,28 +137,35 @@ class GridSettingsWidget(QWidget):
     @property
     def settings(self) -> GridSettings:
         """Get current grid settings."""
-        return GridSettings(
-            tile_width=self._tile_width.value(),
-            tile_height=self._tile_height.value(),
-            separator_x=self._sep_x.value(),
-            separator_y=self._sep_y.value(),
-            offset_x=self._offset_x.value(),
-            offset_y=self._offset_y.value(),
-        )
+        if self._settings is None:
+            self._settings = GridSettings(
+                tile_width=self._tile_width.value(),
+                tile_height=self._tile_height.value(),
+                separator_x=self._sep_x.value(),
+                separator_y=self._sep_y.value(),
+                offset_x=self._offset_x.value(),
+                offset_y=self._offset_y.value(),
+            )
+        # Callers get their own copy to modify
+        return replace(self._settings)
 
     @settings.setter
     def settings(self, value: GridSettings) -> None:
-        """Set grid settings."""
-        self._block_signals = True
-
-        self._tile_width.setValue(value.tile_width)
-        self._tile_height.setValue(value.tile_height)
-        self._sep_x.setValue(value.separator_x)
-        self._sep_y.setValue(value.separator_y)
-        self._offset_x.setValue(value.offset_x)
-        self._offset_y.setValue(value.offset_y)
-
-        self._block_signals = False
+        """Set grid settings (without emitting settings_changed)."""
+        for spinbox, spin_value in (
+            (self._tile_width, value.tile_width),
+            (self._tile_height, value.tile_height),
+            (self._sep_x, value.separator_x),
+            (self._sep_y, value.separator_y),
+            (self._offset_x, value.offset_x),
+            (self._offset_y, value.offset_y),
+        ):
+            # Blocked at the source, so valueChanged isn't dispatched at all
+            with QSignalBlocker(spinbox):
+                spinbox.setValue(spin_value)
+
+        # Read back on next access, since the spinboxes clamp to their range
+        self._settings = None
 
     @property
     def show_grid(self) -> bool:
@@ -187,8 +195,8 @@ class GridSettingsWidget(QWidget):
 
     def _on_setting_changed(self) -> None:
         """Handle any setting change."""
-        if not self._block_signals:
-            self.settings_changed.emit()
+        self._settings = None
+        self.settings_changed.emit()
 
     def _on_grid_visibility_changed(self, visible: bool) -> None:
         """Handle grid visibility toggle."""
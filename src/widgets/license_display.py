@@ -2,25 +2,57 @@
 
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal, QThread, QObject
-from PySide6.QtGui import QPixmap, QPainter, QColor
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QPixmap, QPixmapCache, QPainter, QColor
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QLineEdit, QPushButton, QGroupBox,
     QDialog, QDialogButtonBox, QFormLayout,
 )
 
-from ..models import LicenseInfo, LicenseWarning, get_license_url
+from ..models import LicenseInfo, LicenseWarning, classify_license, get_license_url
+from ..services import LicenseExtractor
+
+# Warning icon and label style for a license, by first matching warning:
+# (warning, icon color, icon text, label style)
+_WARNING_DISPLAY = (
+    (LicenseWarning.NO_DERIVATIVES, "red", "!", "color: #ff6666;"),
+    (LicenseWarning.NON_COMMERCIAL, "yellow", "!", "color: #ffcc00;"),
+    (LicenseWarning.UNKNOWN, "orange", "?", "color: #ff9900;"),
+    (LicenseWarning.MISSING, "gray", "?", "color: #888;"),
+    (LicenseWarning.SHARE_ALIKE, "blue", "i", "color: #88ccff;"),
+)
+_NO_WARNING_STYLE = "color: #88ff88;"
+
+# License edit dialog warning preview styles
+_PREVIEW_STYLE_NEUTRAL = "QLabel { padding: 10px; background: #333; border-radius: 5px; }"
+_PREVIEW_STYLE_HINT = (
+    "QLabel { padding: 10px; background: #333; border-radius: 5px; color: #888; }"
+)
+_PREVIEW_STYLE_OK = (
+    "QLabel { padding: 10px; background: #225522; border-radius: 5px; color: #88ff88; }"
+)
+_PREVIEW_STYLE_CAUTION = (
+    "QLabel { padding: 10px; background: #665522; border-radius: 5px; color: #ffcc00; }"
+)
+_PREVIEW_STYLE_ERROR = (
+    "QLabel { padding: 10px; background: #662222; border-radius: 5px; color: #ff8888; }"
+)
 
 
-class LicenseFetchWorker(QObject):
-    """Worker to fetch license info in a background thread."""
+class LicenseFetchSignals(QObject):
+    """Signals for LicenseFetchWorker (a QRunnable can't have its own)."""
 
     finished = Signal(object)  # Emits LicenseInfo
     error = Signal(str)  # Emits error message
 
+
+class LicenseFetchWorker(QRunnable):
+    """Worker to fetch license info on the shared thread pool."""
+
     def __init__(self, url: str):
         super().__init__()
+        self.signals = LicenseFetchSignals()
         self._url = url
         self._cancelled = False
 
@@ -34,17 +66,15 @@ class LicenseFetchWorker(QObject):
             return
 
         try:
-            from ..services import LicenseExtractor
-
             extractor = LicenseExtractor()
             info = extractor.fetch_license_from_url(self._url)
 
             if not self._cancelled:
-                self.finished.emit(info)
+                self.signals.finished.emit(info)
 
         except Exception as e:
             if not self._cancelled:
-                self.error.emit(str(e))
+                self.signals.error.emit(str(e))
 
 
 class LicenseDisplayWidget(QWidget):
@@ -58,6 +88,7 @@ class LicenseDisplayWidget(QWidget):
         super().__init__(parent)
 
         self._license_info = LicenseInfo()
+        self._label_style = ""  # Last style set on the license label
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -65,15 +96,20 @@ class LicenseDisplayWidget(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
 
+        # Icon and license text share one tooltip, set on their container
+        self._license_box = QWidget()
+        box_layout = QHBoxLayout(self._license_box)
+        box_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._license_box)
+
         # Warning icon
         self._warning_icon = QLabel()
         self._warning_icon.setFixedSize(20, 20)
-        layout.addWidget(self._warning_icon)
+        box_layout.addWidget(self._warning_icon)
 
         # License text
         self._license_label = QLabel("No license")
-        self._license_label.setStyleSheet("color: #888;")
-        layout.addWidget(self._license_label)
+        box_layout.addWidget(self._license_label)
 
         layout.addStretch()
 
@@ -101,34 +137,38 @@ class LicenseDisplayWidget(QWidget):
         self._license_label.setText(self._license_info.display_name)
 
         # Update warning icon
-        if LicenseWarning.NO_DERIVATIVES in self._license_info.warnings:
-            self._set_warning_icon("red", "!")
-            self._license_label.setStyleSheet("color: #ff6666;")
-        elif LicenseWarning.NON_COMMERCIAL in self._license_info.warnings:
-            self._set_warning_icon("yellow", "!")
-            self._license_label.setStyleSheet("color: #ffcc00;")
-        elif LicenseWarning.UNKNOWN in self._license_info.warnings:
-            self._set_warning_icon("orange", "?")
-            self._license_label.setStyleSheet("color: #ff9900;")
-        elif LicenseWarning.MISSING in self._license_info.warnings:
-            self._set_warning_icon("gray", "?")
-            self._license_label.setStyleSheet("color: #888;")
-        elif LicenseWarning.SHARE_ALIKE in self._license_info.warnings:
-            self._set_warning_icon("blue", "i")
-            self._license_label.setStyleSheet("color: #88ccff;")
+        warnings = self._license_info.warnings
+        for warning, color, text, style in _WARNING_DISPLAY:
+            if warning in warnings:
+                self._set_warning_icon(color, text)
+                break
         else:
             self._warning_icon.clear()
-            self._license_label.setStyleSheet("color: #88ff88;")
+            style = _NO_WARNING_STYLE
 
-        # Set tooltip
-        if self._license_info.warning_message:
-            self._warning_icon.setToolTip(self._license_info.warning_message)
-            self._license_label.setToolTip(self._license_info.warning_message)
-        else:
-            self._warning_icon.setToolTip("")
-            self._license_label.setToolTip("")
+        # Restyling makes Qt re-parse the sheet, so skip it if unchanged
+        if style != self._label_style:
+            self._license_label.setStyleSheet(style)
+            self._label_style = style
+
+        # Set tooltip (Qt doesn't skip unchanged tooltips itself)
+        message = self._license_info.warning_message
+        if message != self._license_box.toolTip():
+            self._license_box.setToolTip(message)
 
     def _set_warning_icon(self, color: str, text: str) -> None:
+        """Show a warning icon, painting it the first time it's used."""
+        # Kept in QPixmapCache rather than a class attribute, so painted
+        # icons don't outlive the QApplication
+        key = f"license_icon:{color}:{text}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._paint_warning_icon(color, text)
+            QPixmapCache.insert(key, pixmap)
+        self._warning_icon.setPixmap(pixmap)
+
+    @staticmethod
+    def _paint_warning_icon(color: str, text: str) -> QPixmap:
         """Create a simple warning icon."""
         pixmap = QPixmap(20, 20)
         pixmap.fill(Qt.GlobalColor.transparent)
@@ -157,7 +197,7 @@ class LicenseDisplayWidget(QWidget):
         painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
 
         painter.end()
-        self._warning_icon.setPixmap(pixmap)
+        return pixmap
 
     def _show_license_dialog(self) -> None:
         """Show dialog for editing license information."""
@@ -179,7 +219,6 @@ class LicenseEditDialog(QDialog):
         super().__init__(parent)
 
         self._license_info = license_info
-        self._fetch_thread: Optional[QThread] = None
         self._fetch_worker: Optional[LicenseFetchWorker] = None
         self._setup_ui()
         self._populate()
@@ -235,14 +274,17 @@ class LicenseEditDialog(QDialog):
         # Warning preview
         self._warning_preview = QLabel("")
         self._warning_preview.setWordWrap(True)
-        self._warning_preview.setStyleSheet(
-            "QLabel { padding: 10px; background: #333; border-radius: 5px; }"
-        )
+        self._warning_preview.setStyleSheet(_PREVIEW_STYLE_NEUTRAL)
+        self._preview_style = _PREVIEW_STYLE_NEUTRAL
         layout.addWidget(self._warning_preview)
 
         # Update preview and auto-fill URL when license text changes
-        self._license_text.textChanged.connect(self._update_warning_preview)
-        self._license_text.textChanged.connect(self._auto_fill_license_url)
+        # (debounced, so typing a license name updates once)
+        self._text_timer = QTimer(self)
+        self._text_timer.setSingleShot(True)
+        self._text_timer.setInterval(150)  # 150ms debounce
+        self._text_timer.timeout.connect(self._on_license_text_changed)
+        self._license_text.textChanged.connect(self._text_timer.start)
 
         # Buttons
         buttons = QDialogButtonBox(
@@ -260,8 +302,22 @@ class LicenseEditDialog(QDialog):
         self._author.setText(self._license_info.author)
         self._source_url.setText(self._license_info.source_url)
         self._fetch_url.setText(self._license_info.source_url)
+
+        # The stored URL is kept as is, so only the preview is updated
+        self._text_timer.stop()
         self._update_warning_preview()
 
+    def _on_license_text_changed(self) -> None:
+        """Update the preview and URL after the license text settles."""
+        self._update_warning_preview()
+        self._auto_fill_license_url()
+
+    def _flush_license_text(self) -> None:
+        """Apply a pending license text change now."""
+        if self._text_timer.isActive():
+            self._text_timer.stop()
+            self._on_license_text_changed()
+
     def _auto_fill_license_url(self) -> None:
         """Auto-fill license URL if license text matches a known license."""
         license_text = self._license_text.text().strip()
@@ -280,36 +336,30 @@ class LicenseEditDialog(QDialog):
 
     def _update_warning_preview(self) -> None:
         """Update the warning preview based on current license text."""
-        temp_info = LicenseInfo(
-            license_text=self._license_text.text(),
-            license_url=self._license_url.text(),
-        )
-
-        if temp_info.warning_message:
-            self._warning_preview.setText(temp_info.warning_message)
-            if LicenseWarning.NO_DERIVATIVES in temp_info.warnings:
-                self._warning_preview.setStyleSheet(
-                    "QLabel { padding: 10px; background: #662222; border-radius: 5px; color: #ff8888; }"
-                )
-            elif LicenseWarning.NON_COMMERCIAL in temp_info.warnings:
-                self._warning_preview.setStyleSheet(
-                    "QLabel { padding: 10px; background: #665522; border-radius: 5px; color: #ffcc00; }"
-                )
+        license_text = self._license_text.text()
+        warnings, message = classify_license(license_text)
+
+        if message:
+            self._warning_preview.setText(message)
+            if LicenseWarning.NO_DERIVATIVES in warnings:
+                self._set_preview_style(_PREVIEW_STYLE_ERROR)
+            elif LicenseWarning.NON_COMMERCIAL in warnings:
+                self._set_preview_style(_PREVIEW_STYLE_CAUTION)
             else:
-                self._warning_preview.setStyleSheet(
-                    "QLabel { padding: 10px; background: #333; border-radius: 5px; }"
-                )
+                self._set_preview_style(_PREVIEW_STYLE_NEUTRAL)
         else:
-            if temp_info.license_text:
+            if license_text:
                 self._warning_preview.setText("No license issues detected.")
-                self._warning_preview.setStyleSheet(
-                    "QLabel { padding: 10px; background: #225522; border-radius: 5px; color: #88ff88; }"
-                )
+                self._set_preview_style(_PREVIEW_STYLE_OK)
             else:
                 self._warning_preview.setText("Enter license information above.")
-                self._warning_preview.setStyleSheet(
-                    "QLabel { padding: 10px; background: #333; border-radius: 5px; color: #888; }"
-                )
+                self._set_preview_style(_PREVIEW_STYLE_HINT)
+
+    def _set_preview_style(self, style: str) -> None:
+        """Restyle the warning preview, skipping Qt's re-parse if unchanged."""
+        if style != self._preview_style:
+            self._warning_preview.setStyleSheet(style)
+            self._preview_style = style
 
     def _fetch_license(self) -> None:
         """Start fetching license info from the provided URL in a background thread."""
@@ -326,35 +376,32 @@ class LicenseEditDialog(QDialog):
         self._cancel_btn.setVisible(True)
         self._fetch_url.setEnabled(False)
 
-        # Create worker and thread
-        self._fetch_thread = QThread()
+        # Create worker; signals arrive queued on this (GUI) thread
         self._fetch_worker = LicenseFetchWorker(url)
-        self._fetch_worker.moveToThread(self._fetch_thread)
-
-        # Connect signals
-        self._fetch_thread.started.connect(self._fetch_worker.run)
-        self._fetch_worker.finished.connect(self._on_fetch_finished)
-        self._fetch_worker.error.connect(self._on_fetch_error)
-        self._fetch_worker.finished.connect(self._fetch_thread.quit)
-        self._fetch_worker.error.connect(self._fetch_thread.quit)
-        self._fetch_thread.finished.connect(self._cleanup_fetch)
+        signals = self._fetch_worker.signals
+        signals.finished.connect(self._on_fetch_finished)
+        signals.error.connect(self._on_fetch_error)
+        signals.finished.connect(self._cleanup_fetch)
+        signals.error.connect(self._cleanup_fetch)
 
-        # Start
-        self._fetch_thread.start()
+        # Run on the shared pool rather than starting a thread per fetch
+        QThreadPool.globalInstance().start(self._fetch_worker)
 
     def _cancel_fetch(self) -> None:
-        """Cancel the current fetch operation."""
+        """Cancel the current fetch operation.
+
+        A running request isn't interrupted; the worker just skips reporting.
+        """
         if self._fetch_worker:
             self._fetch_worker.cancel()
-        if self._fetch_thread and self._fetch_thread.isRunning():
-            self._fetch_thread.quit()
-            self._fetch_thread.wait(1000)  # Wait up to 1 second
         self._cleanup_fetch()
 
     def _on_fetch_finished(self, info: LicenseInfo) -> None:
         """Handle successful fetch."""
         if info.license_text:
             self._license_text.setText(info.license_text)
+            # Auto-fill first, so a fetched URL takes precedence
+            self._flush_license_text()
         if info.license_url:
             self._license_url.setText(info.license_url)
         if info.author:
@@ -365,9 +412,7 @@ class LicenseEditDialog(QDialog):
     def _on_fetch_error(self, error_msg: str) -> None:
         """Handle fetch error."""
         self._warning_preview.setText(f"Fetch failed: {error_msg}")
-        self._warning_preview.setStyleSheet(
-            "QLabel { padding: 10px; background: #662222; border-radius: 5px; color: #ff8888; }"
-        )
+        self._set_preview_style(_PREVIEW_STYLE_ERROR)
 
     def _cleanup_fetch(self) -> None:
         """Clean up after fetch completes or is cancelled."""
@@ -376,7 +421,11 @@ class LicenseEditDialog(QDialog):
         self._cancel_btn.setVisible(False)
         self._fetch_url.setEnabled(True)
         self._fetch_worker = None
-        self._fetch_thread = None
+
+    def accept(self) -> None:
+        """Handle dialog acceptance - apply any pending text change."""
+        self._flush_license_text()
+        super().accept()
 
     def reject(self) -> None:
         """Handle dialog rejection - cancel any pending fetch."""
@@ -3,7 +3,7 @@
 from typing import Optional
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtGui import QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QGroupBox, QSizePolicy,
@@ -26,6 +26,7 @@ class TileEditor(QWidget):
 
         self._tile: Optional[Tile] = None
         self._duplicate_count: int = 1
+        self._preview_tile: Optional[Tile] = None  # Tile the preview shows
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -92,19 +93,31 @@ class TileEditor(QWidget):
     @tile.setter
     def tile(self, value: Optional[Tile]) -> None:
         """Set the tile to edit."""
+        if value is self._tile:
+            self._refresh_name()
+            return
         self._tile = value
         self._update_display()
 
     def set_tile_with_duplicates(self, tile: Optional[Tile], duplicate_count: int = 1) -> None:
         """Set the tile with duplicate count info."""
+        if tile is self._tile and duplicate_count == self._duplicate_count:
+            self._refresh_name()
+            return
         self._tile = tile
         self._duplicate_count = duplicate_count
         self._update_display()
 
+    def _refresh_name(self) -> None:
+        """Show the current tile's name if it changed (e.g. by undo)."""
+        if self._tile is not None and self._name_edit.text() != self._tile.name:
+            self.set_name(self._tile.name)
+
     def _update_display(self) -> None:
         """Update the display for the current tile."""
         if self._tile is None:
             self._preview_label.clear()
+            self._preview_tile = None
             self._info_label.setText("No tile selected")
             self._duplicate_label.setVisible(False)
             self._name_edit.clear()
@@ -112,16 +125,12 @@ class TileEditor(QWidget):
             self._filename_label.clear()
             return
 
-        # Update preview
-        if self._tile.image:
-            pixmap = QPixmap.fromImage(self._tile.image)
-            # Scale up for preview, keeping pixel-perfect
-            scaled = pixmap.scaled(
-                self.PREVIEW_SIZE, self.PREVIEW_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.FastTransformation  # No smoothing for pixel art
-            )
-            self._preview_label.setPixmap(scaled)
+        # Update preview (kept when the same tile is set again)
+        if self._tile is not self._preview_tile:
+            pixmap = self._get_preview_pixmap(self._tile)
+            if pixmap is not None:
+                self._preview_label.setPixmap(pixmap)
+            self._preview_tile = self._tile
 
         # Update info
         self._info_label.setText(
@@ -149,6 +158,27 @@ class TileEditor(QWidget):
         # Update filename preview
         self._update_filename_preview()
 
+    def _get_preview_pixmap(self, tile: Tile) -> Optional[QPixmap]:
+        """Get a tile's scaled preview, cached across selections."""
+        key = f"tile_preview:{self.PREVIEW_SIZE}:{tile.pixels_key}"
+        scaled = QPixmapCache.find(key)
+        if scaled is not None:
+            return scaled
+
+        tile_image = tile.image
+        if not tile_image:
+            return None
+
+        pixmap = QPixmap.fromImage(tile_image)
+        # Scale up for preview, keeping pixel-perfect
+        scaled = pixmap.scaled(
+            self.PREVIEW_SIZE, self.PREVIEW_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation  # No smoothing for pixel art
+        )
+        QPixmapCache.insert(key, scaled)
+        return scaled
+
     def _update_filename_preview(self) -> None:
         """Update the filename preview label."""
         if self._tile is None:
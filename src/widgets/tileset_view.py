@@ -1,22 +1,165 @@
 """Tileset view widget with grid overlay."""
 
-from pathlib import Path
+import os
+from bisect import bisect_left, bisect_right
+from enum import Flag, auto
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal, QRectF, QPointF
+from PySide6.QtCore import Qt, Signal, QRect, QRectF, QPointF, QLineF, QSize, QTimer
 from PySide6.QtGui import (
-    QImage, QPainter, QPen, QColor, QBrush,
+    QImage, QPixmap, QPainter, QPainterPath, QPen, QColor, QBrush, QFont,
     QDragEnterEvent, QDropEvent, QMouseEvent, QWheelEvent,
 )
 from PySide6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem,
-    QGraphicsRectItem, QWidget,
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPathItem,
+    QGraphicsPixmapItem, QStyleOptionGraphicsItem, QWidget,
 )
 
 from ..models import Tileset, GridSettings
 from ..utils import SUPPORTED_FORMATS
 
 
+def _cosmetic_pen(color: QColor, width: int) -> QPen:
+    """Create a pen that stays the same width on screen at any zoom."""
+    pen = QPen(color)
+    pen.setWidth(width)
+    pen.setCosmetic(True)
+    return pen
+
+
+class _Dirty(Flag):
+    """Parts of the scene waiting to be brought up to date."""
+
+    NONE = 0
+    GRID_VISIBILITY = auto()
+    GRID = auto()
+    SELECTION = auto()
+    OVERLAYS = auto()
+    DISPLAY = auto()  # Whole scene, including everything above
+
+
+class _GridItem(QGraphicsItem):
+    """Grid overlay as a single item, painted with a drawLines call per axis."""
+
+    def __init__(self, pen: QPen):
+        super().__init__()
+        self._pen = pen
+        self._rect = QRectF()
+
+        # Line positions (sorted) and their lines, per axis
+        self._xs: list[int] = []
+        self._ys: list[int] = []
+        self._vertical: list[QLineF] = []
+        self._horizontal: list[QLineF] = []
+
+        # Have paint() told which part of the grid is exposed
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def set_grid(self, gs: GridSettings, width: int, height: int) -> None:
+        """Lay out the grid lines for an image size."""
+        self.prepareGeometryChange()
+        self._rect = QRectF(0, 0, width, height)
+
+        # A line at the start of each tile, plus one at its end when
+        # tiles are separated by a gap
+        self._xs = self._positions(gs.offset_x, gs.tile_width, gs.separator_x, width)
+        self._ys = self._positions(gs.offset_y, gs.tile_height, gs.separator_y, height)
+
+        self._vertical = [QLineF(x, 0, x, height) for x in self._xs]
+        self._horizontal = [QLineF(0, y, width, y) for y in self._ys]
+        self.update()
+
+    @staticmethod
+    def _positions(offset: int, size: int, separator: int, limit: int) -> list[int]:
+        """Get the grid line positions along one axis, up to limit."""
+        step = size + separator
+        positions = list(range(offset, limit + 1, step))
+        if separator > 0:
+            positions += range(offset + size, limit + 1, step)
+            positions.sort()
+        return positions
+
+    def boundingRect(self) -> QRectF:
+        """Get the image rect the grid covers."""
+        return self._rect
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        """Draw the grid lines within the exposed area."""
+        # Widen the area by a device pixel, so lines just outside it
+        # still draw their (cosmetic) width
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        pad = 1 / lod if lod > 0 else 0
+        area = option.exposedRect.adjusted(-pad, -pad, pad, pad)
+
+        painter.setPen(self._pen)
+        xs, ys = self._xs, self._ys
+        painter.drawLines(
+            self._vertical[bisect_left(xs, area.left()):bisect_right(xs, area.right())]
+        )
+        painter.drawLines(
+            self._horizontal[bisect_left(ys, area.top()):bisect_right(ys, area.bottom())]
+        )
+
+
+class _SelectionItem(QGraphicsItem):
+    """Selected tile and its duplicates as a single item.
+
+    Tiles are pixel-aligned, so rects are kept as integer QRects, and all
+    duplicates are painted with one drawRects call.
+    """
+
+    def __init__(self, pen: QPen, brush: QBrush, duplicate_pen: QPen, duplicate_brush: QBrush):
+        super().__init__()
+        self._pen = pen
+        self._brush = brush
+        self._duplicate_pen = duplicate_pen
+        self._duplicate_brush = duplicate_brush
+        self._rect = QRectF()
+
+        self._primary: Optional[QRect] = None
+        self._duplicates: list[QRect] = []
+
+    def set_rects(self, primary: Optional[QRect], duplicates: list[QRect]) -> None:
+        """Set the selected tile's rect and its duplicates' rects."""
+        self.prepareGeometryChange()
+        self._primary = primary
+        self._duplicates = duplicates
+
+        bounds = QRect()
+        for rect in duplicates:
+            bounds |= rect
+        if primary is not None:
+            bounds |= primary
+        # Leave room for the outline, which straddles the rect edges
+        self._rect = QRectF(bounds).adjusted(-1, -1, 1, 1) if bounds.isValid() else QRectF()
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        """Get the area covered by the selection rects."""
+        return self._rect
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        """Draw the duplicates, then the selected tile over them."""
+        if self._duplicates:
+            painter.setPen(self._duplicate_pen)
+            painter.setBrush(self._duplicate_brush)
+            painter.drawRects(self._duplicates)
+        if self._primary is not None:
+            painter.setPen(self._pen)
+            painter.setBrush(self._brush)
+            painter.drawRect(self._primary)
+
+
 class TilesetView(QGraphicsView):
     """Widget for displaying and interacting with a tileset image."""
 
@@ -32,29 +175,82 @@ class TilesetView(QGraphicsView):
     DUPLICATE_FILL = QColor(255, 200, 0, 30)
     LABELED_OVERLAY = QColor(0, 0, 0, 150)  # Semi-transparent black for labeled tiles
 
+    # Pens and brushes for the colors above, built once
+    _GRID_PEN = _cosmetic_pen(GRID_COLOR, 1)  # Always 1 pixel regardless of zoom
+    _SELECTION_PEN = _cosmetic_pen(SELECTION_COLOR, 2)
+    _SELECTION_BRUSH = QBrush(SELECTION_FILL)
+    _DUPLICATE_PEN = _cosmetic_pen(DUPLICATE_COLOR, 2)
+    _DUPLICATE_BRUSH = QBrush(DUPLICATE_FILL)
+    _OVERLAY_BRUSH = QBrush(LABELED_OVERLAY)
+    _NO_PEN = QPen(Qt.PenStyle.NoPen)
+
+    # Wheel zoom limits (view pixels per image pixel)
+    MIN_ZOOM = 0.01
+    MAX_ZOOM = 100.0
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
-        # Setup scene
+        # Setup scene. Overlay items are replaced on every grid change and
+        # selection, so a BSP index would be rebuilt far more often than
+        # it's queried
         self._scene = QGraphicsScene(self)
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self._scene)
 
         # Image item
         self._image_item: Optional[QGraphicsPixmapItem] = None
 
+        # Pixmap of the displayed image and the image's cacheKey, so
+        # redisplaying an unchanged image skips converting it again
+        self._pixmap: Optional[QPixmap] = None
+        self._pixmap_key: int = 0
+
+        # Image size the view was last fit to (None until an image is shown)
+        self._fitted_size: Optional[QSize] = None
+
         # Grid overlay items
-        self._grid_lines: list = []
-        self._selection_rects: list[QGraphicsRectItem] = []  # Multiple for duplicates
-        self._labeled_overlays: list[QGraphicsRectItem] = []  # Overlays for labeled tiles
+        self._grid_item: Optional[_GridItem] = None
+        self._selection_item: Optional[_SelectionItem] = None  # Includes duplicates
+        self._labeled_overlay: Optional[QGraphicsPathItem] = None  # Greys out labeled tiles
+
+        # (tileset, version) the labeled overlay was built for, or None if
+        # it's empty because labeled tiles aren't hidden
+        self._overlay_key: Optional[tuple[Tileset, int]] = None
 
         # State
         self._tileset: Optional[Tileset] = None
         self._show_grid = True
         self._hide_labeled = False  # Toggle to grey out labeled tiles
 
+        # Scene updates not yet applied; changes that arrive together
+        # (e.g. a new tileset and its view settings) share one update
+        self._dirty = _Dirty.NONE
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_updates)
+
+        # Wheel zoom not yet applied; ticks that arrive together are
+        # combined into one scale() (and one repaint)
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(0)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+
         # Configure view
         self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        # The image fills the view, so repaint it whole rather than
+        # tracking dirty regions per item
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Every item sets the pen and brush it paints with, and nothing is
+        # antialiased, so skip saving painter state and padding repaints
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setOptimizationFlag(
+            QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True
+        )
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
@@ -76,8 +272,12 @@ class TilesetView(QGraphicsView):
     @tileset.setter
     def tileset(self, value: Optional[Tileset]) -> None:
         """Set the tileset and update display."""
+        if value is not self._tileset:
+            # A different tileset is always fit to the view, even if its
+            # image is the same size as the last one
+            self._fitted_size = None
         self._tileset = value
-        self._update_display()
+        self._schedule_update(_Dirty.DISPLAY)
 
     @property
     def show_grid(self) -> bool:
@@ -88,7 +288,7 @@ class TilesetView(QGraphicsView):
     def show_grid(self, value: bool) -> None:
         """Set grid visibility."""
         self._show_grid = value
-        self._update_grid_visibility()
+        self._schedule_update(_Dirty.GRID_VISIBILITY)
 
     @property
     def hide_labeled(self) -> bool:
@@ -99,43 +299,77 @@ class TilesetView(QGraphicsView):
     def hide_labeled(self, value: bool) -> None:
         """Set whether to hide (grey out) labeled tiles."""
         self._hide_labeled = value
-        self._update_labeled_overlays()
+        self._schedule_update(_Dirty.OVERLAYS)
 
     def set_image(self, image: QImage) -> None:
         """Set the tileset image directly."""
         if self._tileset is None:
             return
         self._tileset.image = image
-        self._update_display()
+        self._schedule_update(_Dirty.DISPLAY)
 
     def update_grid(self) -> None:
         """Update the grid overlay after settings change."""
         if self._tileset:
             self._tileset.regenerate_tiles()
-        self._draw_grid()
-        self._update_selection()
-        self._update_labeled_overlays()
+        self._schedule_update(_Dirty.GRID | _Dirty.SELECTION | _Dirty.OVERLAYS)
 
     def refresh_overlays(self) -> None:
         """Refresh the labeled overlays (call after tile naming changes)."""
-        self._update_labeled_overlays()
+        self._schedule_update(_Dirty.OVERLAYS)
+
+    def _schedule_update(self, dirty: _Dirty) -> None:
+        """Mark parts of the scene for updating on the next event loop pass.
+
+        The tileset itself is changed right away by callers; only the
+        scene work is deferred, so it runs once however many changes
+        come in before then.
+        """
+        self._dirty |= dirty
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_updates(self) -> None:
+        """Apply the scene updates marked by _schedule_update."""
+        self._update_timer.stop()
+        dirty, self._dirty = self._dirty, _Dirty.NONE
+
+        if _Dirty.DISPLAY in dirty:
+            # Rebuilding the scene redraws everything but the selection
+            self._update_display()
+            self._update_selection()
+            return
+
+        if _Dirty.GRID in dirty:
+            self._draw_grid()
+        elif _Dirty.GRID_VISIBILITY in dirty:
+            self._update_grid_visibility()
+        if _Dirty.SELECTION in dirty:
+            self._update_selection()
+        if _Dirty.OVERLAYS in dirty:
+            self._update_labeled_overlays()
 
     def _update_display(self) -> None:
         """Update the entire display."""
         self._scene.clear()
         self._image_item = None
-        self._grid_lines = []
-        self._selection_rects = []
-        self._labeled_overlays = []
+        self._grid_item = None
+        self._selection_item = None
+        self._labeled_overlay = None
+        self._overlay_key = None
 
         if self._tileset is None or self._tileset.image is None:
+            self._pixmap = None
+            self._fitted_size = None
             self._update_placeholder()
             return
 
         # Add image
-        from PySide6.QtGui import QPixmap
-        pixmap = QPixmap.fromImage(self._tileset.image)
-        self._image_item = self._scene.addPixmap(pixmap)
+        image = self._tileset.image
+        if self._pixmap is None or image.cacheKey() != self._pixmap_key:
+            self._pixmap = QPixmap.fromImage(image)
+            self._pixmap_key = image.cacheKey()
+        self._image_item = self._scene.addPixmap(self._pixmap)
         self._image_item.setZValue(0)
 
         # Set scene rect
@@ -147,14 +381,14 @@ class TilesetView(QGraphicsView):
         # Draw labeled overlays
         self._update_labeled_overlays()
 
-        # Fit in view
-        self.fitInView(self._scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        # Fit in view, unless this tileset already showed an image of the
+        # same size (then the user's zoom and scroll position still apply)
+        if image.size() != self._fitted_size:
+            self.fitInView(self._scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+            self._fitted_size = image.size()
 
     def _update_placeholder(self) -> None:
         """Show placeholder text when no image is loaded."""
-        from PySide6.QtWidgets import QGraphicsTextItem
-        from PySide6.QtGui import QFont
-
         text = self._scene.addText("Drop a tileset image here")
         text.setDefaultTextColor(QColor(150, 150, 150))
         font = QFont()
@@ -167,124 +401,93 @@ class TilesetView(QGraphicsView):
 
     def _draw_grid(self) -> None:
         """Draw the grid overlay."""
-        # Remove old grid lines
-        for item in self._grid_lines:
-            self._scene.removeItem(item)
-        self._grid_lines = []
-
         if self._tileset is None or self._tileset.image is None:
+            if self._grid_item is not None:
+                self._scene.removeItem(self._grid_item)
+                self._grid_item = None
             return
 
-        if not self._show_grid:
-            return
+        if self._grid_item is None:
+            self._grid_item = _GridItem(self._GRID_PEN)
+            self._grid_item.setZValue(1)
+            # Panning blits the rendered grid instead of redrawing its lines
+            self._grid_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            self._scene.addItem(self._grid_item)
 
-        gs = self._tileset.grid_settings
         img = self._tileset.image
+        self._grid_item.set_grid(self._tileset.grid_settings, img.width(), img.height())
 
-        pen = QPen(self.GRID_COLOR)
-        pen.setWidth(1)
-        pen.setCosmetic(True)  # Always 1 pixel regardless of zoom
-
-        # Draw vertical lines
-        x = gs.offset_x
-        while x <= img.width():
-            line = self._scene.addLine(x, 0, x, img.height(), pen)
-            line.setZValue(1)
-            self._grid_lines.append(line)
-
-            # Move to next tile boundary
-            x += gs.tile_width
-            if x <= img.width():
-                # Add separator line if there's a gap
-                if gs.separator_x > 0:
-                    sep_line = self._scene.addLine(x, 0, x, img.height(), pen)
-                    sep_line.setZValue(1)
-                    self._grid_lines.append(sep_line)
-                x += gs.separator_x
-
-        # Draw horizontal lines
-        y = gs.offset_y
-        while y <= img.height():
-            line = self._scene.addLine(0, y, img.width(), y, pen)
-            line.setZValue(1)
-            self._grid_lines.append(line)
-
-            y += gs.tile_height
-            if y <= img.height():
-                if gs.separator_y > 0:
-                    sep_line = self._scene.addLine(0, y, img.width(), y, pen)
-                    sep_line.setZValue(1)
-                    self._grid_lines.append(sep_line)
-                y += gs.separator_y
+        # Laid out even while hidden, so showing it later needs no redraw
+        self._grid_item.setVisible(self._show_grid)
 
     def _update_grid_visibility(self) -> None:
-        """Update visibility of grid lines."""
-        for item in self._grid_lines:
-            item.setVisible(self._show_grid)
+        """Update visibility of the grid."""
+        if self._grid_item is not None:
+            self._grid_item.setVisible(self._show_grid)
 
     def _update_labeled_overlays(self) -> None:
-        """Update overlays that grey out labeled tiles."""
-        # Remove old overlays
-        for item in self._labeled_overlays:
-            self._scene.removeItem(item)
-        self._labeled_overlays = []
-
-        if self._tileset is None or not self._hide_labeled:
+        """Update the overlay that greys out labeled tiles."""
+        # Tile names and the grid only change along with the version, so
+        # an unchanged key means the overlay is already up to date
+        key = None
+        if self._tileset is not None and self._hide_labeled:
+            key = (self._tileset, self._tileset.version)
+        if key == self._overlay_key:
             return
-
-        # Create overlay for each labeled tile
-        brush = QBrush(self.LABELED_OVERLAY)
-        pen = QPen(Qt.PenStyle.NoPen)
-
-        for tile in self._tileset.tiles:
-            if tile.is_labeled:
-                overlay = self._scene.addRect(
-                    tile.pixel_x, tile.pixel_y,
-                    tile.width, tile.height,
-                    pen, brush
-                )
-                overlay.setZValue(1.5)  # Above image, below selection
-                self._labeled_overlays.append(overlay)
+        self._overlay_key = key
+
+        # One path covering every labeled tile, rather than an item per tile
+        path = QPainterPath()
+        path.setFillRule(Qt.FillRule.WindingFill)
+
+        if key is not None:
+            for tile in self._tileset.tiles:
+                if tile.is_labeled:
+                    path.addRect(tile.pixel_x, tile.pixel_y, tile.width, tile.height)
+
+        if self._labeled_overlay is not None:
+            self._labeled_overlay.setPath(path)
+        elif not path.isEmpty():
+            self._labeled_overlay = self._scene.addPath(
+                path, self._NO_PEN, self._OVERLAY_BRUSH
+            )
+            self._labeled_overlay.setZValue(1.5)  # Above image, below selection
+            # Only changes when tiles are renamed, so panning blits it too
+            self._labeled_overlay.setCacheMode(
+                QGraphicsItem.CacheMode.DeviceCoordinateCache
+            )
 
     def _update_selection(self) -> None:
         """Update the selection highlight (including duplicates)."""
-        # Remove old selection rects
-        for item in self._selection_rects:
-            self._scene.removeItem(item)
-        self._selection_rects = []
-
-        if self._tileset is None:
-            return
-
-        tile = self._tileset.selected_tile
-        if tile is None:
-            return
-
-        # Get all selected indices (including duplicates)
-        selected_indices = self._tileset.selected_tile_indices
-        primary_index = self._tileset.selected_tile_index
-
-        for idx in selected_indices:
-            t = self._tileset.tiles[idx]
-
-            # Use different colors for primary vs duplicate selections
-            if idx == primary_index:
-                pen = QPen(self.SELECTION_COLOR)
-                brush = QBrush(self.SELECTION_FILL)
-            else:
-                pen = QPen(self.DUPLICATE_COLOR)
-                brush = QBrush(self.DUPLICATE_FILL)
-
-            pen.setWidth(2)
-            pen.setCosmetic(True)
-
-            rect = self._scene.addRect(
-                t.pixel_x, t.pixel_y,
-                t.width, t.height,
-                pen, brush
+        primary: Optional[QRect] = None
+        duplicates: list[QRect] = []
+
+        if self._tileset is not None and self._tileset.selected_tile is not None:
+            # Get all selected indices (including duplicates)
+            selected_indices = self._tileset.selected_tile_indices
+            primary_index = self._tileset.selected_tile_index
+
+            for idx in selected_indices:
+                t = self._tileset.tiles[idx]
+                rect = QRect(t.pixel_x, t.pixel_y, t.width, t.height)
+
+                # Primary and duplicate selections use different colors
+                if idx == primary_index:
+                    primary = rect
+                else:
+                    duplicates.append(rect)
+
+        if self._selection_item is None:
+            if primary is None and not duplicates:
+                return
+            self._selection_item = _SelectionItem(
+                self._SELECTION_PEN, self._SELECTION_BRUSH,
+                self._DUPLICATE_PEN, self._DUPLICATE_BRUSH,
             )
-            rect.setZValue(2)
-            self._selection_rects.append(rect)
+            self._selection_item.setZValue(2)
+            self._scene.addItem(self._selection_item)
+
+        self._selection_item.set_rects(primary, duplicates)
 
     def select_tile(self, index: int) -> None:
         """Select a tile by index."""
@@ -293,7 +496,7 @@ class TilesetView(QGraphicsView):
 
         if 0 <= index < len(self._tileset.tiles):
             self._tileset.selected_tile_index = index
-            self._update_selection()
+            self._schedule_update(_Dirty.SELECTION)
 
     # Event handlers
 
@@ -314,7 +517,7 @@ class TilesetView(QGraphicsView):
                         int(scene_pos.y())
                     )
                     if index is not None:
-                        self._update_selection()
+                        self._schedule_update(_Dirty.SELECTION)
                         self.tile_selected.emit(index)
                         return
 
@@ -326,9 +529,40 @@ class TilesetView(QGraphicsView):
         factor = 1.15
 
         if event.angleDelta().y() > 0:
-            self.scale(factor, factor)
+            self._pending_zoom *= factor
+        else:
+            self._pending_zoom /= factor
+        self._zoom_timer.start()
+
+    def _apply_pending_zoom(self) -> None:
+        """Apply the wheel zoom accumulated since the last one."""
+        factor = self._pending_zoom
+        self._pending_zoom = 1.0
+
+        # Clamp to the zoom limits (without jumping back inside them if
+        # fitting the view already went past one)
+        current = self.transform().m11()
+        if factor < 1:
+            target = max(current * factor, min(current, self.MIN_ZOOM))
         else:
-            self.scale(1 / factor, 1 / factor)
+            target = min(current * factor, max(current, self.MAX_ZOOM))
+        clamped = target != current * factor
+
+        # Hold back steps that would resize the image by less than a
+        # pixel; unless clamped, they add up with the next ones
+        rect = self._scene.sceneRect()
+        if abs(target - current) * max(rect.width(), rect.height(), 1) < 1:
+            if not clamped:
+                self._pending_zoom = factor
+            return
+
+        factor = target / current
+        self.scale(factor, factor)
+
+    def _discard_pending_zoom(self) -> None:
+        """Drop wheel zoom not yet applied (before setting the zoom outright)."""
+        self._zoom_timer.stop()
+        self._pending_zoom = 1.0
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter for file drops."""
@@ -336,7 +570,9 @@ class TilesetView(QGraphicsView):
             urls = event.mimeData().urls()
             if urls:
                 path = urls[0].toLocalFile()
-                ext = Path(path).suffix.lower().lstrip(".")
+                # Called repeatedly during a drag, so the extension is
+                # taken with string ops rather than a Path object
+                ext = os.path.splitext(path)[1][1:].lower()
                 if ext in SUPPORTED_FORMATS:
                     event.acceptProposedAction()
                     return
@@ -360,8 +596,10 @@ class TilesetView(QGraphicsView):
     def reset_zoom(self) -> None:
         """Reset zoom to fit the image in view."""
         if self._tileset and self._tileset.image:
+            self._discard_pending_zoom()
             self.fitInView(self._scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
 
     def zoom_to_actual(self) -> None:
         """Zoom to 100% (1:1 pixel)."""
+        self._discard_pending_zoom()
         self.resetTransform()
@@ -0,0 +1,152 @@
+"""Tests for reading license metadata straight from PNG and JPEG bytes."""
+
+import struct
+import zlib
+
+from PIL import Image
+
+from src.models import LicenseWarning
+from src.services.image_loader import ImageLoader
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IHDR = struct.pack(">IIBBBBB", 1, 1, 8, 6, 0, 0, 0)  # 1x1 RGBA
+IDAT = zlib.compress(b"\x00\x00\x00\x00\x00")
+XMP_PREFIX = b"http://ns.adobe.com/xap/1.0/\0"
+
+
+def png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(chunk_type + data)
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def write_png(path, *chunks: bytes):
+    path.write_bytes(
+        PNG_SIGNATURE
+        + png_chunk(b"IHDR", IHDR)
+        + png_chunk(b"IDAT", IDAT)
+        + b"".join(chunks)
+        + png_chunk(b"IEND", b"")
+    )
+    return path
+
+
+def jpeg_segment(code: int, data: bytes) -> bytes:
+    return bytes((0xFF, code)) + struct.pack(">H", len(data) + 2) + data
+
+
+def test_png_text_chunks(tmp_path):
+    path = write_png(
+        tmp_path / "text.png",
+        png_chunk(b"tEXt", b"Copyright\0CC BY 4.0"),
+        png_chunk(b"zTXt", b"Author\0\0" + zlib.compress(b"Alice")),
+        png_chunk(b"iTXt", b"Source\0\0\0en\0\0" + "https://example.com/é".encode()),
+    )
+    text_chunks, _, _ = ImageLoader()._scan_png_metadata(str(path))
+    assert text_chunks == {
+        "Copyright": "CC BY 4.0",
+        "Author": "Alice",
+        "Source": "https://example.com/é",
+    }
+
+    info = ImageLoader().extract_license_info(path)
+    assert info.license_text == "CC BY 4.0"
+    assert info.author == "Alice"
+    assert info.normalized_name == "CC BY 4.0"
+
+
+def test_png_compressed_itxt(tmp_path):
+    path = write_png(
+        tmp_path / "itxt.png",
+        png_chunk(b"iTXt", b"License\0\1\0\0\0" + zlib.compress(b"CC0 1.0")),
+    )
+    text_chunks, _, _ = ImageLoader()._scan_png_metadata(str(path))
+    assert text_chunks == {"License": "CC0 1.0"}
+
+
+def test_png_undecodable_chunks_are_skipped(tmp_path):
+    path = write_png(
+        tmp_path / "bad.png",
+        png_chunk(b"tEXt", b"Copyright\0CC BY 4.0 by Alice"),
+        png_chunk(b"iTXt", b"Comment\0\0\0\0\0\xff\xfe bad"),
+        png_chunk(b"zTXt", b"Author\0\0not zlib"),
+        png_chunk(b"iTXt", b"Source\0\1\0\0\0not zlib"),
+    )
+    text_chunks, _, _ = ImageLoader()._scan_png_metadata(str(path))
+    assert text_chunks == {"Copyright": "CC BY 4.0 by Alice"}
+
+    info = ImageLoader().extract_license_info(path)
+    assert info.license_text == "CC BY 4.0 by Alice"
+    assert LicenseWarning.MISSING not in info.warnings
+
+
+def test_png_inflate_is_capped(tmp_path):
+    limit = ImageLoader.PNG_TEXT_LIMIT
+    path = write_png(
+        tmp_path / "bomb.png",
+        png_chunk(b"zTXt", b"Comment\0\0" + zlib.compress(b"a" * (limit * 4))),
+    )
+    text_chunks, _, _ = ImageLoader()._scan_png_metadata(str(path))
+    assert len(text_chunks["Comment"]) == limit
+
+
+def test_png_text_after_image_data(tmp_path):
+    # Chunks are written after IDAT by write_png, so they're found
+    # without decoding the pixels
+    path = write_png(tmp_path / "late.png", png_chunk(b"tEXt", b"Artist\0Bob"))
+    assert ImageLoader().extract_license_info(path).author == "Bob"
+
+
+def test_png_without_metadata_is_missing(tmp_path):
+    path = write_png(tmp_path / "plain.png")
+    assert ImageLoader()._scan_png_metadata(str(path)) == ({}, None, b"")
+    info = ImageLoader().extract_license_info(path)
+    assert info.warnings == frozenset({LicenseWarning.MISSING})
+
+
+def test_jpeg_exif(tmp_path):
+    path = tmp_path / "exif.jpg"
+    exif = Image.Exif()
+    exif[0x8298] = "CC BY-SA 4.0"  # Copyright
+    exif[0x013B] = "Carol"  # Artist
+    Image.new("RGB", (8, 8)).save(path, exif=exif.tobytes())
+
+    info = ImageLoader().extract_license_info(path)
+    assert info.license_text == "CC BY-SA 4.0"
+    assert info.author == "Carol"
+
+
+def test_jpeg_xmp(tmp_path):
+    xmp = (
+        b'<x:xmpmeta xmlns:x="adobe:ns:meta/"><rdf:RDF '
+        b'xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        b'xmlns:cc="http://creativecommons.org/ns#">'
+        b'<rdf:Description cc:license="https://creativecommons.org/licenses/by/4.0/"/>'
+        b"</rdf:RDF></x:xmpmeta>"
+    )
+    path = tmp_path / "xmp.jpg"
+    path.write_bytes(b"\xff\xd8" + jpeg_segment(0xE1, XMP_PREFIX + xmp) + b"\xff\xd9")
+
+    _, exif_data, xmp_data = ImageLoader()._scan_jpeg_metadata(str(path))
+    assert exif_data is None
+    assert xmp_data == xmp
+
+
+def test_jpeg_truncated_app1(tmp_path):
+    # The APP1 length claims more bytes than the file has
+    path = tmp_path / "short.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xe1" + struct.pack(">H", 1000) + XMP_PREFIX + b"<x:xmp")
+
+    _, exif_data, xmp_data = ImageLoader()._scan_jpeg_metadata(str(path))
+    assert exif_data is None
+    assert xmp_data == b"<x:xmp"
+    info = ImageLoader().extract_license_info(path)
+    assert info.warnings == frozenset({LicenseWarning.MISSING})
+
+
+def test_jpeg_without_metadata_is_missing(tmp_path):
+    path = tmp_path / "plain.jpg"
+    Image.new("RGB", (8, 8)).save(path)
+
+    assert ImageLoader()._scan_jpeg_metadata(str(path)) == ({}, None, b"")
+    info = ImageLoader().extract_license_info(path)
+    assert info.warnings == frozenset({LicenseWarning.MISSING})
@@ -0,0 +1,15 @@
+"""Tests for license info parsing."""
+
+from src.models import LicenseInfo, LicenseWarning
+
+
+def test_warnings_follow_text_not_stored_name():
+    info = LicenseInfo.from_dict(
+        {"license": "CC BY-NC 4.0", "normalized_name": "CC BY 4.0"}
+    )
+    assert info.warnings == frozenset({LicenseWarning.NON_COMMERCIAL})
+
+
+def test_from_dict_round_trip_keeps_warnings():
+    info = LicenseInfo(license_text="CC BY-SA 4.0")
+    assert LicenseInfo.from_dict(info.to_dict()).warnings == info.warnings
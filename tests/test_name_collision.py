@@ -0,0 +1,93 @@
+"""Tests for name collision utilities."""
+
+import os
+
+import pytest
+
+from src.utils.name_collision import find_next_set_index, resolve_collision
+
+
+def test_resolve_collision_without_collision():
+    assert resolve_collision("grass", {"dirt.png"}, "png") == "grass.png"
+
+
+def test_resolve_collision_appends_first_free_suffix():
+    used = {"grass.png", "grass_1.png", "grass_3.png"}
+    assert resolve_collision("grass", used, "png") == "grass_2.png"
+
+
+def test_resolve_collision_next_suffixes_matches_plain_calls():
+    plain_used = {"grass.png", "grass_2.png"}
+    memo_used = set(plain_used)
+    next_suffixes: dict[str, int] = {}
+
+    for _ in range(5):
+        plain = resolve_collision("grass", plain_used, "png")
+        memo = resolve_collision("grass", memo_used, "png", next_suffixes)
+        assert memo == plain
+        plain_used.add(plain)
+        memo_used.add(memo)
+
+    assert memo_used == plain_used
+    assert next_suffixes == {"grass": 7}
+
+
+def test_resolve_collision_starts_from_next_suffix():
+    # Suffixes below the memo are assumed taken and aren't probed again
+    used = {"grass.png"}
+    assert resolve_collision("grass", used, "png", {"grass": 5}) == "grass_5.png"
+
+
+def test_resolve_collision_next_suffixes_per_base_name():
+    used = {"grass.png", "grass_1.png", "dirt.png"}
+    next_suffixes = {"grass": 2}
+    assert resolve_collision("dirt", used, "png", next_suffixes) == "dirt_1.png"
+    assert next_suffixes == {"grass": 2, "dirt": 2}
+
+
+def test_resolve_collision_unused_name_leaves_next_suffixes():
+    next_suffixes = {"grass": 3}
+    assert resolve_collision("dirt", set(), "png", next_suffixes) == "dirt.png"
+    assert next_suffixes == {"grass": 3}
+
+
+def test_resolve_collision_limit():
+    used = {"grass.png"} | {f"grass_{i}.png" for i in range(1, 10000)}
+    assert resolve_collision("grass", used, "png") == "grass_10000.png"
+
+    used.add("grass_10000.png")
+    with pytest.raises(ValueError):
+        resolve_collision("grass", used, "png")
+
+
+def test_resolve_collision_limit_with_next_suffixes():
+    next_suffixes = {"grass": 10000}
+    assert resolve_collision("grass", {"grass.png"}, "png", next_suffixes) == "grass_10000.png"
+    assert next_suffixes == {"grass": 10001}
+
+    with pytest.raises(ValueError):
+        resolve_collision("grass", {"grass.png"}, "png", next_suffixes)
+
+
+def test_find_next_set_index(tmp_path):
+    assert find_next_set_index(tmp_path / "missing") == 0
+    assert find_next_set_index(tmp_path) == 0
+
+    (tmp_path / "tileset_0").mkdir()
+    (tmp_path / "tileset_4").mkdir()
+    (tmp_path / "tileset_x").mkdir()
+    (tmp_path / "tileset_9").write_text("not a folder")
+    assert find_next_set_index(tmp_path) == 5
+    assert find_next_set_index(tmp_path, prefix="other") == 0
+
+
+def test_find_next_set_index_sees_folder_added_within_same_mtime(tmp_path):
+    (tmp_path / "tileset_0").mkdir()
+    stat = os.stat(tmp_path)
+    assert find_next_set_index(tmp_path) == 1
+
+    # A filesystem with coarse timestamps can leave the parent's mtime
+    # unchanged when a folder is added
+    (tmp_path / "tileset_1").mkdir()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert find_next_set_index(tmp_path) == 2